@@ -0,0 +1,38 @@
+"""Textual application for Checkmate."""
+
+from typing import ClassVar
+
+from textual.app import App
+from textual.binding import Binding
+
+from .screens import TodoListScreen
+from .services import TodoService
+
+
+class CheckmateApp(App):
+    TITLE = "Checkmate"
+    CSS_PATH = "checkmate.tcss"
+
+    BINDINGS: ClassVar[list] = [
+        ("q", "quit", "Quit"),
+        Binding("question_mark", "toggle_help_panel", "Help", key_display="?"),
+    ]
+
+    def __init__(self, service: TodoService, config: dict[str, str] | None = None):
+        self._help_panel_visible = False
+        super().__init__()
+        self.service = service
+        self.config = config or {}
+
+    async def on_mount(self) -> None:
+        """Push the main screen when the app starts."""
+        await self.push_screen(TodoListScreen())
+
+    def action_toggle_help_panel(self) -> None:
+        """Toggle the help panel visibility."""
+        if self._help_panel_visible:
+            self.action_hide_help_panel()
+            self._help_panel_visible = False
+        else:
+            self.action_show_help_panel()
+            self._help_panel_visible = True
@@ -1,6 +1,41 @@
 import os
+import shutil
+import sys
+from functools import cache
 from pathlib import Path
 
+# Parsed config keyed by path, validated against (st_mtime_ns, st_size)
+_CONFIG_CACHE: dict[str, tuple[tuple[int, int], dict[str, str]]] = {}
+
+
+@cache
+def _home() -> str:
+    """Return the user's home directory, expanded once per process."""
+    return os.path.expanduser("~")
+
+
+@cache
+def _real_home() -> str:
+    """Return the home directory with symlinks resolved, once per process."""
+    return os.path.realpath(_home())
+
+
+def _resolve_in_home(name: str) -> str:
+    """Resolve a file directly inside the (already canonical) home directory.
+
+    Only the final component can still be a symlink, so a single lstat is
+    enough for the common case instead of a full realpath walk.
+    """
+    path = os.path.join(_real_home(), name)
+    if os.path.islink(path):
+        return os.path.realpath(path)
+    return path
+
+
+def _clear_config_cache() -> None:
+    """Drop all cached config parses."""
+    _CONFIG_CACHE.clear()
+
 
 def load_config(content: str) -> dict[str, str]:
     """
@@ -17,23 +52,16 @@ def load_config(content: str) -> dict[str, str]:
     Returns:
         Dictionary mapping keys to values
     """
-    config = {}
-
-    for line in content.splitlines():
-        # Skip comments and empty lines
-        line = line.strip()
-        if not line or line.startswith("#"):
-            continue
-
-        # Skip lines without = separator
-        if "=" not in line:
-            continue
-
-        # Split on first = only
-        key, value = line.split("=", 1)
-        config[key.strip()] = value
-
-    return config
+    # Split on the first = only; blank lines have no separator either
+    return {
+        sys.intern(key.strip()): value
+        for key, sep, value in (
+            line.partition("=")
+            for line in map(str.strip, content.splitlines())
+            if not line.startswith("#")
+        )
+        if sep
+    }
 
 
 def discover_files(
@@ -61,27 +89,22 @@ def discover_files(
         Tuple of (todo_file_path, done_file_path) with symlinks resolved
     """
     config = config or {}
-    home = os.path.expanduser("~")
 
-    # Determine todo file path
+    # Determine todo file path; defaults are resolved against the cached home
     if cli_todo_file:
-        todo_file = cli_todo_file
+        todo_file = os.path.realpath(cli_todo_file)
     elif "TODO_FILE" in config:
-        todo_file = config["TODO_FILE"]
+        todo_file = os.path.realpath(config["TODO_FILE"])
     else:
-        todo_file = os.path.join(home, "todo.txt")
+        todo_file = _resolve_in_home("todo.txt")
 
     # Determine done file path
     if cli_done_file:
-        done_file = cli_done_file
+        done_file = os.path.realpath(cli_done_file)
     elif "DONE_FILE" in config:
-        done_file = config["DONE_FILE"]
+        done_file = os.path.realpath(config["DONE_FILE"])
     else:
-        done_file = os.path.join(home, "done.txt")
-
-    # Resolve symlinks to canonical paths
-    todo_file = os.path.realpath(todo_file)
-    done_file = os.path.realpath(done_file)
+        done_file = _resolve_in_home("done.txt")
 
     return todo_file, done_file
 
@@ -90,7 +113,8 @@ def load_config_file(home_dir: str | None = None) -> dict[str, str]:
     """
     Load configuration from .todo/config file in home directory.
 
-    Returns empty dict if file doesn't exist.
+    Returns empty dict if file doesn't exist. Parsed results are cached
+    until the file's mtime or size changes.
 
     Args:
         home_dir: Override home directory (useful for testing)
@@ -99,26 +123,34 @@ def load_config_file(home_dir: str | None = None) -> dict[str, str]:
         Configuration dictionary, empty if file doesn't exist
     """
     if home_dir is None:
-        home_dir = os.path.expanduser("~")
+        home_dir = _home()
 
     config_path = os.path.join(home_dir, ".todo", "config")
 
-    if not os.path.exists(config_path):
+    try:
+        st = os.stat(config_path)
+    except OSError:
         return {}
 
+    validator = (st.st_mtime_ns, st.st_size)
+    cached = _CONFIG_CACHE.get(config_path)
+    if cached is not None and cached[0] == validator:
+        return dict(cached[1])
+
     try:
         content = Path(config_path).read_text()
-        return load_config(content)
     except OSError:
         return {}
 
+    config = load_config(content)
+    _CONFIG_CACHE[config_path] = (validator, config)
+    return dict(config)
+
 
 VALID_SORT_ATTRIBUTES = frozenset({"priority", "context", "project", "due", "created"})
 
 
-def save_config_value(
-    key: str, value: str, home_dir: str | None = None
-) -> None:
+def save_config_value(key: str, value: str, home_dir: str | None = None) -> None:
     """
     Save a single key=value pair to the .todo/config file.
 
@@ -131,33 +163,43 @@ def save_config_value(
         home_dir: Override home directory (useful for testing)
     """
     if home_dir is None:
-        home_dir = os.path.expanduser("~")
+        home_dir = _home()
 
     config_dir = Path(home_dir) / ".todo"
     config_path = config_dir / "config"
 
-    # Read existing lines (preserving comments and structure)
-    lines: list[str] = []
-    if config_path.exists():
-        try:
-            lines = config_path.read_text().splitlines()
-        except OSError:
-            lines = []
+    # Read existing content (preserving comments and structure)
+    content = ""
+    try:
+        content = config_path.read_text()
+    except OSError:
+        pass
 
-    # Try to update existing key in-place
+    # Single pass: copy lines through, replacing the first matching key
+    new_line = f"{key}={value}"
+    lines: list[str] = []
     updated = False
-    for i, line in enumerate(lines):
-        stripped = line.strip()
-        if stripped and not stripped.startswith("#") and "=" in stripped:
-            existing_key, _ = stripped.split("=", 1)
-            if existing_key.strip() == key:
-                lines[i] = f"{key}={value}"
-                updated = True
-                break
+    for line in content.splitlines():
+        if not updated:
+            stripped = line.strip()
+            if stripped and not stripped.startswith("#"):
+                existing_key, sep, _ = stripped.partition("=")
+                if sep and existing_key.strip() == key:
+                    line = new_line
+                    updated = True
+        lines.append(line)
 
     if not updated:
-        lines.append(f"{key}={value}")
+        lines.append(new_line)
 
-    # Write back
+    # Write to a sibling temp file and swap it in so a crash never leaves a
+    # truncated config behind. Resolve first so a symlinked config keeps its
+    # link and the file it points at keeps its permissions.
     config_dir.mkdir(parents=True, exist_ok=True)
-    config_path.write_text("\n".join(lines) + "\n")
+    target = config_path.resolve()
+    tmp_path = target.with_name(target.name + ".tmp")
+    tmp_path.write_text("\n".join(lines) + "\n")
+    if target.exists():
+        shutil.copymode(target, tmp_path)
+    os.replace(tmp_path, target)
+    _clear_config_cache()
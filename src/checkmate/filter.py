@@ -0,0 +1,39 @@
+"""Context and project filtering of tasks, independent of any widget."""
+
+from dataclasses import dataclass
+
+from .models import Task
+
+
+@dataclass(slots=True, frozen=True)
+class TaskFilter:
+    """Tasks to show: those with ANY of the contexts OR ANY of the projects.
+
+    An empty filter (both sets empty) matches every task.
+    """
+
+    contexts: frozenset[str] = frozenset()
+    projects: frozenset[str] = frozenset()
+
+    @property
+    def is_active(self) -> bool:
+        """Return True if the filter hides anything."""
+        return bool(self.contexts or self.projects)
+
+    def matches(self, task: Task) -> bool:
+        """Check if a task passes the filter."""
+        if not self.is_active:
+            return True
+        # isdisjoint walks the task's tag list; no per-task set is built
+        return not (
+            self.contexts.isdisjoint(task.contexts)
+            and self.projects.isdisjoint(task.projects)
+        )
+
+    def select(self, tasks: list[Task]) -> list[Task]:
+        """Return the tasks that pass the filter, in order."""
+        # Inactive, skip the per-task check altogether
+        if not self.is_active:
+            return tasks
+        matches = self.matches
+        return [task for task in tasks if matches(task)]
@@ -1,61 +1,63 @@
 """Checkmate - A terminal user interface client for todos.txt files."""
 
-import argparse
 import sys
-from typing import ClassVar
-
-from textual.app import App
-from textual.binding import Binding
+from typing import NoReturn
 
 from .config import discover_files, load_config_file
-from .repository import FileTaskRepository
-from .screens import TodoListScreen
-from .services import TodoService
 
+_USAGE = "usage: checkmate [-h] [--todo TODO] [--done DONE]"
 
-class CheckmateApp(App):
-    TITLE = "Checkmate"
-    CSS_PATH = "checkmate.tcss"
+_HELP = f"""{_USAGE}
 
-    BINDINGS: ClassVar[list] = [
-        ("q", "quit", "Quit"),
-        Binding("question_mark", "toggle_help_panel", "Help", key_display="?"),
-    ]
+Checkmate - A terminal user interface client for todos.txt files.
 
-    def __init__(self, service: TodoService, config: dict[str, str] | None = None):
-        self._help_panel_visible = False
-        super().__init__()
-        self.service = service
-        self.config = config or {}
+options:
+  -h, --help   show this help message and exit
+  --todo TODO  Path to todo.txt file
+  --done DONE  Path to done.txt file
+"""
 
-    async def on_mount(self) -> None:
-        """Push the main screen when the app starts."""
-        await self.push_screen(TodoListScreen())
 
-    def action_toggle_help_panel(self) -> None:
-        """Toggle the help panel visibility."""
-        if self._help_panel_visible:
-            self.action_hide_help_panel()
-            self._help_panel_visible = False
-        else:
-            self.action_show_help_panel()
-            self._help_panel_visible = True
+def _usage_error(message: str) -> NoReturn:
+    """Print usage and an error message, then exit like argparse does."""
+    print(f"{_USAGE}\ncheckmate: error: {message}", file=sys.stderr)
+    sys.exit(2)
 
 
-def parse_args() -> tuple[str | None, str | None]:
+def parse_args(argv: list[str] | None = None) -> tuple[str | None, str | None]:
     """Parse command-line arguments.
 
+    Accepts `--todo PATH`, `--todo=PATH` and the same forms for `--done`.
+    A plain scan is enough for two options and avoids importing argparse.
+
+    Args:
+        argv: Arguments to parse, defaults to `sys.argv[1:]`
+
     Returns:
         Tuple of (todo_file, done_file) paths.
     """
-    parser = argparse.ArgumentParser(
-        description="Checkmate - A terminal user interface client for todos.txt files."
-    )
-    parser.add_argument("--todo", help="Path to todo.txt file")
-    parser.add_argument("--done", help="Path to done.txt file")
-
-    args = parser.parse_args()
-    return args.todo, args.done
+    args = sys.argv[1:] if argv is None else argv
+    values: dict[str, str | None] = {"--todo": None, "--done": None}
+
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg in ("-h", "--help"):
+            print(_HELP, end="")
+            sys.exit(0)
+
+        name, sep, value = arg.partition("=")
+        if name not in values:
+            _usage_error(f"unrecognized arguments: {arg}")
+        if not sep:
+            i += 1
+            if i >= len(args) or args[i].startswith("-"):
+                _usage_error(f"argument {name}: expected one argument")
+            value = args[i]
+        values[name] = value
+        i += 1
+
+    return values["--todo"], values["--done"]
 
 
 def main():
@@ -73,6 +75,12 @@ def main():
             config=config,
         )
 
+        # Textual and the storage layer are only imported once the arguments
+        # are known to be good, keeping --help and usage errors fast
+        from .app import CheckmateApp
+        from .repository import FileTaskRepository
+        from .services import TodoService
+
         # Launch app with discovered file paths
         repository = FileTaskRepository(todo_file=todo_file, done_file=done_file)
         service = TodoService(repository)
@@ -1,10 +1,53 @@
 import re
+import sys
+import time
 from dataclasses import dataclass, field
-from datetime import date, datetime
+from datetime import date
+from functools import lru_cache
 
 # Type alias for attributes
 Attributes = dict[str, str | list[str]]
 
+# Using \S to match any non-whitespace character, consistent with todo.txt spec
+_PROJECT_RE = re.compile(r"\+(\S+)")
+_CONTEXT_RE = re.compile(r"@(\S+)")
+
+# ASCII digits only, as todo.txt dates are written
+_ISO_DATE_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})", re.ASCII)
+
+# Rendering checks due status for every task; re-read the clock at most once
+# per second instead of once per property access.
+_TODAY_TTL = 1.0
+_today_checked_at = float("-inf")
+_today_value = date.today()
+
+
+def _today() -> date:
+    """Return today's date, refreshed at most once per `_TODAY_TTL` seconds."""
+    global _today_checked_at, _today_value
+    now = time.monotonic()
+    if now - _today_checked_at > _TODAY_TTL:
+        _today_value = date.today()
+        _today_checked_at = now
+    return _today_value
+
+
+@lru_cache(maxsize=256)
+def parse_iso_date(value: str) -> date | None:
+    """Parse a strict YYYY-MM-DD string, returning None if malformed.
+
+    Cheaper than `datetime.strptime` for the single fixed todo.txt format,
+    and cached: due dates repeat across tasks and while scrubbing the form.
+    """
+    match = _ISO_DATE_RE.fullmatch(value)
+    if match is None:
+        return None
+    year, month, day = match.groups()
+    try:
+        return date(int(year), int(month), int(day))
+    except ValueError:
+        return None
+
 
 @dataclass(slots=True)
 class Task:
@@ -16,6 +59,10 @@ class Task:
     projects: list[str] = field(default_factory=list)
     contexts: list[str] = field(default_factory=list)
     attributes: Attributes = field(default_factory=dict)
+    # (raw "due" value, parsed date) from the last due_date lookup
+    _due_cache: tuple[str, date | None] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         """Parse projects and contexts from description if not provided."""
@@ -24,9 +71,20 @@ class Task:
 
     def refresh_metadata(self):
         """Parse projects and contexts from description."""
-        # Using \S to match any non-whitespace character, consistent with todo.txt spec
-        self.projects = re.findall(r"\+(\S+)", self.description)
-        self.contexts = re.findall(r"@(\S+)", self.description)
+        description = self.description
+        # Untagged tasks, which re-enter here from __post_init__ on every load,
+        # skip the regex scans; tags repeat heavily across tasks, so interning
+        # shares one string each
+        self.projects = (
+            [sys.intern(tag) for tag in _PROJECT_RE.findall(description)]
+            if "+" in description
+            else []
+        )
+        self.contexts = (
+            [sys.intern(tag) for tag in _CONTEXT_RE.findall(description)]
+            if "@" in description
+            else []
+        )
 
     @property
     def id(self) -> str | None:
@@ -45,11 +103,16 @@ class Task:
 
         if isinstance(due_str, list):
             due_str = due_str[0]
+        due_str = str(due_str)
 
-        try:
-            return datetime.strptime(str(due_str), "%Y-%m-%d").date()
-        except (ValueError, TypeError):
-            return None
+        # Reuse the last parse while the raw attribute value is unchanged
+        cached = self._due_cache
+        if cached is not None and cached[0] == due_str:
+            return cached[1]
+
+        parsed = parse_iso_date(due_str)
+        self._due_cache = (due_str, parsed)
+        return parsed
 
     @due_date.setter
     def due_date(self, value: date | None):
@@ -58,21 +121,47 @@ class Task:
             if "due" in self.attributes:
                 del self.attributes["due"]
         else:
-            self.attributes["due"] = value.strftime("%Y-%m-%d")
+            due_str = value.isoformat()
+            self.attributes["due"] = due_str
+            self._due_cache = (due_str, value)
+
+    @property
+    def display_due(self) -> str:
+        """Get the due date as YYYY-MM-DD, or "" if absent or malformed."""
+        due = self.due_date
+        cached = self._due_cache
+        if due is None or cached is None:
+            return ""
+        # A raw value that parsed is already in ISO form; reuse it as is
+        return cached[0]
+
+    @property
+    def display_created(self) -> str:
+        """Get the creation date as YYYY-MM-DD, or "" if unset."""
+        created = self.creation_date
+        return created.isoformat() if created else ""
+
+    @property
+    def display_completed(self) -> str:
+        """Get the completion date as YYYY-MM-DD, or "" if unset."""
+        completed = self.completion_date
+        return completed.isoformat() if completed else ""
 
     @property
     def is_overdue(self) -> bool:
         """Check if task is overdue."""
-        if self.is_completed or not self.due_date:
+        if self.is_completed:
             return False
-        return self.due_date < datetime.now().date()
+        due = self.due_date
+        return due is not None and due < _today()
 
     @property
     def is_due_today(self) -> bool:
         """Check if task is due today."""
-        if self.is_completed or not self.due_date:
+        if self.is_completed:
             return False
-        return self.due_date == datetime.now().date()
+        due = self.due_date
+        return due is not None and due == _today()
 
     def complete(self):
         """Mark task as completed."""
@@ -1,9 +1,13 @@
 """Textual screens for the todos app."""
 
-from .confirm import ConfirmScreen
-from .create_task import CreateTaskScreen
-from .filter import FilterResult, FilterScreen
-from .todo_list import TodoListScreen
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .confirm import ConfirmScreen
+    from .create_task import CreateTaskScreen
+    from .filter import FilterResult, FilterScreen
+    from .todo_list import TodoListScreen
 
 __all__ = [
     "ConfirmScreen",
@@ -12,3 +16,22 @@ __all__ = [
     "FilterScreen",
     "TodoListScreen",
 ]
+
+# Screens are imported on first access (PEP 562), so startup only loads
+# the screens that are actually used
+_SCREEN_MODULES = {
+    "ConfirmScreen": ".confirm",
+    "CreateTaskScreen": ".create_task",
+    "FilterResult": ".filter",
+    "FilterScreen": ".filter",
+    "TodoListScreen": ".todo_list",
+}
+
+
+def __getattr__(name: str):
+    module = _SCREEN_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
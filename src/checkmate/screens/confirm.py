@@ -11,11 +11,11 @@ from textual.widgets import Button, Label
 class ConfirmScreen(ModalScreen[bool]):
     """A modal screen for confirming actions."""
 
-    BINDINGS: ClassVar[list] = [
+    BINDINGS: ClassVar[tuple] = (
         ("escape", "cancel", "Cancel"),
         ("y", "confirm", "Confirm"),
         ("n", "cancel", "Cancel"),
-    ]
+    )
 
     DEFAULT_CSS = """
     ConfirmScreen {
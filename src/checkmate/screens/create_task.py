@@ -1,11 +1,12 @@
 """Task creation/editing screen component."""
 
 import logging
-from datetime import date, datetime, timedelta
+from datetime import date, timedelta
+from string import ascii_uppercase
 from typing import TYPE_CHECKING, ClassVar, cast
 
 if TYPE_CHECKING:
-    from ..main import CheckmateApp
+    from ..app import CheckmateApp
 
 from textual.app import ComposeResult
 from textual.containers import Container, Horizontal, Vertical
@@ -15,15 +16,26 @@ from textual.screen import Screen
 from textual.widgets import Button, Footer, Input, Label, Static, TextArea
 
 from ..exceptions import TaskOperationError, TaskValidationError
-from ..models import Task
+from ..models import Task, parse_iso_date
 
 logger = logging.getLogger(__name__)
 
+# Priority stepping for the up/down keys, wrapping at either end of A-Z
+_NEXT_PRIORITY = dict(zip(ascii_uppercase, ascii_uppercase[1:] + "A", strict=True))
+_PREV_PRIORITY = {after: before for before, after in _NEXT_PRIORITY.items()}
+
+# A todo.txt task is one line: line breaks (and tabs) in the text become spaces
+_FLATTEN_DESCRIPTION = str.maketrans(dict.fromkeys("\n\r\t", " "))
+
+# Button row widths: stack below _STACK_WIDTH, unstack only above _UNSTACK_WIDTH
+_STACK_WIDTH = 28
+_UNSTACK_WIDTH = 32
+
 
 class ResponsiveButtonGroup(Static):
     """Container for buttons that stacks vertically when space is tight."""
 
-    is_vertical = reactive(False, recompose=True)
+    is_vertical = reactive(False)
 
     DEFAULT_CSS = """
     ResponsiveButtonGroup {
@@ -31,51 +43,66 @@ class ResponsiveButtonGroup(Static):
         height: auto;
         margin-top: 2;
     }
-    
+
     ResponsiveButtonGroup Button {
         margin-right: 1;
     }
-    
+
+    ResponsiveButtonGroup.vertical #button-container {
+        layout: vertical;
+    }
+
     ResponsiveButtonGroup.vertical Button {
         width: 100%;
         margin: 0 0 1 0;
     }
     """
 
-    def compose(self) -> ComposeResult:
-        """Create button container with appropriate layout."""
-        if self.is_vertical:
-            container = Vertical(id="button-container")
-        else:
-            container = Horizontal(id="button-container")
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._layout_check_pending = False
+        # Width the layout was last decided for; only width affects it
+        self._last_checked_width = -1
 
-        with container:
+    def compose(self) -> ComposeResult:
+        """Create the button container; the `vertical` class restacks it."""
+        with Horizontal(id="button-container"):
             yield Button("Submit", id="submit-btn", variant="primary")
             yield Button("Cancel", id="cancel-btn", variant="default")
 
     def watch_is_vertical(self, value: bool) -> None:
-        """Update CSS class when layout changes."""
-        if value:
-            self.add_class("vertical")
-        else:
-            self.remove_class("vertical")
+        """Switch layout by CSS class rather than rebuilding the buttons."""
+        self.set_class(value, "vertical")
 
     def on_mount(self) -> None:
         """Check initial size and update layout."""
         self._check_layout()
 
     def on_resize(self, event: Resize) -> None:
-        """Respond to size changes."""
+        """Respond to size changes, once per refresh however many arrive."""
+        if event.size.width == self._last_checked_width:
+            return
+        if not self._layout_check_pending:
+            self._layout_check_pending = True
+            self.call_after_refresh(self._check_pending_layout)
+
+    def _check_pending_layout(self) -> None:
+        """Run the layout check deferred by `on_resize`."""
+        self._layout_check_pending = False
         self._check_layout()
 
     def _check_layout(self) -> None:
         """Determine if buttons should stack vertically."""
+        self._last_checked_width = self.size.width
         # Available width for buttons (accounting for padding)
         available_width = self.size.width - 4  # Account for padding
-        # Estimate needed width: 2 buttons at ~10 chars each + spacing
-        needed_width = 28
-
-        should_be_vertical = available_width < needed_width
+        # Estimate needed width: 2 buttons at ~10 chars each + spacing.
+        # Once stacked, wait for some slack before going back to a row so a
+        # drag across the boundary does not flip the layout on every column.
+        if self.is_vertical:
+            should_be_vertical = available_width <= _UNSTACK_WIDTH
+        else:
+            should_be_vertical = available_width < _STACK_WIDTH
 
         if self.is_vertical != should_be_vertical:
             self.is_vertical = should_be_vertical
@@ -84,16 +111,16 @@ class ResponsiveButtonGroup(Static):
 class CreateTaskScreen(Screen):
     """Screen for creating a new task or editing an existing one."""
 
-    BINDINGS: ClassVar[list] = [
+    BINDINGS: ClassVar[tuple] = (
         ("escape", "cancel", "Cancel"),
         ("ctrl+s", "submit", "Submit"),
-    ]
+    )
 
     DEFAULT_CSS = """
     CreateTaskScreen {
         background: $surface;
     }
-    
+
     CreateTaskScreen > Container {
         width: 100%;
         height: auto;
@@ -101,7 +128,7 @@ class CreateTaskScreen(Screen):
         background: $panel;
         padding: 1 2;
     }
-    
+
     CreateTaskScreen Label#title {
         width: 100%;
         text-align: center;
@@ -109,26 +136,26 @@ class CreateTaskScreen(Screen):
         margin-bottom: 1;
         padding-top: 1;
     }
-    
+
     .help-text {
         height: auto;
         width: auto;
     }
-    
+
     .help-text Label {
         width: auto;
         color: $text-disabled;
         text-style: italic;
     }
-    
+
     .help-text .context {
         color: $secondary;
     }
-    
+
     .help-text .project {
         color: $warning;
     }
-    
+
     /* Common form section styling */
     .form-section {
         width: 100%;
@@ -142,12 +169,12 @@ class CreateTaskScreen(Screen):
         padding: 0;
         margin: 0;
     }
-    
+
     .form-section .help-text {
         margin: 0 0 1 0;
         padding: 0;
     }
-    
+
     .form-section Input, .form-section TextArea {
         width: 100%;
     }
@@ -155,31 +182,36 @@ class CreateTaskScreen(Screen):
     #task-input {
         height: 6;
     }
-    
+
     /* Grid row for side-by-side inputs */
     .form-row {
         width: 100%;
         height: auto;
         margin-bottom: 1;
     }
-    
+
     .priority-col {
         width: 14;
         height: auto;
         margin-right: 2;
     }
-    
+
     .due-date-col {
         width: 20;
         height: auto;
     }
-
-
     """
 
+    # Form inputs, kept from compose so handlers needn't query the DOM
+    _task_input: TextArea
+    _priority_input: Input
+    _due_input: Input
+
     def __init__(self, task: Task | None = None):
         super().__init__()
         self.editing_task = task
+        # The form is short-lived; one clock read serves every key press
+        self._today = date.today()
 
     @property
     def app(self) -> CheckmateApp:
@@ -200,7 +232,8 @@ class CreateTaskScreen(Screen):
                     yield Label(" and ")
                     yield Label("+project", classes="project")
                     yield Label(" to organize")
-                yield TextArea(id="task-input")
+                self._task_input = TextArea(id="task-input")
+                yield self._task_input
 
             # Priority and Due date fields in a row
             with Horizontal(classes="form-row"):
@@ -208,13 +241,17 @@ class CreateTaskScreen(Screen):
                 with Vertical(classes="form-section priority-col"):
                     yield Label("Priority", classes="main-label")
                     yield Label("(A-Z)", classes="help-text")
-                    yield Input(id="priority-input", max_length=1, placeholder="A-Z")
+                    self._priority_input = Input(
+                        id="priority-input", max_length=1, placeholder="A-Z"
+                    )
+                    yield self._priority_input
 
                 # Due date field
                 with Vertical(classes="form-section due-date-col"):
                     yield Label("Due Date", classes="main-label")
                     yield Label("YYYY-MM-DD", classes="help-text")
-                    yield Input(id="due-input", placeholder="YYYY-MM-DD")
+                    self._due_input = Input(id="due-input", placeholder="YYYY-MM-DD")
+                    yield self._due_input
 
             # Buttons (responsive)
             yield ResponsiveButtonGroup()
@@ -223,9 +260,9 @@ class CreateTaskScreen(Screen):
 
     def on_mount(self) -> None:
         """Focus description input on mount and prepopulate if editing."""
-        task_input = self.query_one("#task-input", TextArea)
-        priority_input = self.query_one("#priority-input", Input)
-        due_input = self.query_one("#due-input", Input)
+        task_input = self._task_input
+        priority_input = self._priority_input
+        due_input = self._due_input
 
         # Prepopulate fields if editing
         if self.editing_task:
@@ -233,9 +270,9 @@ class CreateTaskScreen(Screen):
             if self.editing_task.priority:
                 priority_input.value = self.editing_task.priority
             if self.editing_task.due_date:
-                due_input.value = self.editing_task.due_date.strftime("%Y-%m-%d")
+                due_input.value = self.editing_task.due_date.isoformat()
         else:
-            due_input.value = date.today().strftime("%Y-%m-%d")
+            due_input.value = self._today.isoformat()
 
         task_input.focus()
 
@@ -258,36 +295,28 @@ class CreateTaskScreen(Screen):
 
     def _adjust_priority(self, key: str) -> None:
         """Adjust the priority based on key press."""
-        priority_input = self.query_one("#priority-input", Input)
+        priority_input = self._priority_input
         current_value = priority_input.value.strip().upper()
 
-        if not current_value or current_value < "A" or current_value > "Z":
+        if current_value not in _NEXT_PRIORITY:
             # Start at A if empty or invalid
             priority_input.value = "A"
             return
 
-        if key == "up":
-            # A -> B -> C ... -> Z (wraps to A)
-            new_char = chr(ord(current_value) + 1) if current_value < "Z" else "A"
-        else:  # down
-            # Z -> Y -> X ... -> A (wraps to Z)
-            new_char = chr(ord(current_value) - 1) if current_value > "A" else "Z"
-
-        priority_input.value = new_char
+        # up: A -> B ... -> Z -> A, down: Z -> Y ... -> A -> Z
+        steps = _NEXT_PRIORITY if key == "up" else _PREV_PRIORITY
+        priority_input.value = steps[current_value]
 
     def _adjust_due_date(self, key: str) -> None:
         """Adjust the due date based on key press."""
-        due_input = self.query_one("#due-input", Input)
+        due_input = self._due_input
         current_value = due_input.value.strip()
 
-        target_date = date.today()
+        target_date = self._today
 
         if current_value:
-            try:
-                target_date = datetime.strptime(current_value, "%Y-%m-%d").date()
-            except ValueError:
-                # If invalid date, stick with today as base
-                pass
+            # If invalid date, stick with today as base
+            target_date = parse_iso_date(current_value) or target_date
 
         delta_days = 0
         if key == "up":
@@ -300,7 +329,7 @@ class CreateTaskScreen(Screen):
             delta_days = -7
 
         new_date = target_date + timedelta(days=delta_days)
-        due_input.value = new_date.strftime("%Y-%m-%d")
+        due_input.value = new_date.isoformat()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
@@ -317,30 +346,29 @@ class CreateTaskScreen(Screen):
 
     def action_submit(self) -> None:
         """Submit the task."""
-
-        priority_input = self.query_one("#priority-input", Input)
-        task_input = self.query_one("#task-input", TextArea)
-        due_input = self.query_one("#due-input", Input)
+        priority_input = self._priority_input
+        task_input = self._task_input
+        due_input = self._due_input
 
         priority = priority_input.value.strip() or None
         # Flatten newlines to spaces for todo.txt compatibility
-        task_text = task_input.text.strip().replace("\n", " ")
+        task_text = task_input.text.strip().translate(_FLATTEN_DESCRIPTION)
         due_date = due_input.value.strip() or None
 
+        # Cheapest check first: an empty description needs no date parse
+        if not task_text:
+            self.notify("Task description cannot be empty", severity="error")
+            task_input.focus()
+            return
+
         parsed_due_date = None
         if due_date:
-            try:
-                parsed_due_date = datetime.strptime(due_date, "%Y-%m-%d").date()
-            except ValueError:
+            parsed_due_date = parse_iso_date(due_date)
+            if parsed_due_date is None:
                 self.notify("Date must be in YYYY-MM-DD format", severity="error")
                 due_input.focus()
                 return
 
-        if not task_text:
-            self.notify("Task description cannot be empty", severity="error")
-            task_input.focus()
-            return
-
         try:
             if self.editing_task:
                 # Update task
@@ -379,7 +407,8 @@ class CreateTaskScreen(Screen):
         except TaskOperationError as e:
             self.notify(f"Operation failed: {e}", severity="error")
         except Exception as e:
-            logger.exception("Unexpected error in CreateTaskScreen")
+            logger.error("Unexpected error in CreateTaskScreen: %s", e)
+            logger.debug("Unexpected error in CreateTaskScreen", exc_info=True)
             self.notify(f"Unexpected error: {e}", severity="error")
 
     def action_cancel(self) -> None:
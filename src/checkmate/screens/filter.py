@@ -1,5 +1,6 @@
 """Filter modal screen for selecting contexts and projects."""
 
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import ClassVar
 
@@ -10,34 +11,34 @@ from textual.widgets import Button, Label, SelectionList
 from textual.widgets.selection_list import Selection
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FilterResult:
     """Result returned when filter is applied."""
 
-    contexts: list[str]
-    projects: list[str]
+    contexts: tuple[str, ...]
+    projects: tuple[str, ...]
 
 
 class FilterScreen(ModalScreen[FilterResult | None]):
     """Modal screen for filtering by contexts and projects."""
 
-    BINDINGS: ClassVar[list] = [
+    BINDINGS: ClassVar[tuple] = (
         ("escape", "cancel", "Cancel"),
         ("enter", "apply", "Apply"),
-    ]
+    )
 
     def __init__(
         self,
-        contexts: list[str],
-        projects: list[str],
-        selected_contexts: list[str] | None = None,
-        selected_projects: list[str] | None = None,
+        contexts: Iterable[str],
+        projects: Iterable[str],
+        selected_contexts: Iterable[str] | None = None,
+        selected_projects: Iterable[str] | None = None,
     ):
         super().__init__()
-        self._contexts = contexts
-        self._projects = projects
-        self._selected_contexts = set(selected_contexts or [])
-        self._selected_projects = set(selected_projects or [])
+        self._contexts = tuple(sorted(set(contexts)))
+        self._projects = tuple(sorted(set(projects)))
+        self._selected_contexts = frozenset(selected_contexts or ())
+        self._selected_projects = frozenset(selected_projects or ())
 
     def compose(self) -> ComposeResult:
         with Container():
@@ -45,26 +46,24 @@ class FilterScreen(ModalScreen[FilterResult | None]):
 
             with Vertical():
                 yield Label("Contexts", classes="list-label")
-                context_selections = [
-                    Selection(
-                        f"@{ctx}",
-                        ctx,
-                        initial_state=(ctx in self._selected_contexts),
-                    )
-                    for ctx in self._contexts
-                ]
-                yield SelectionList[str](*context_selections, id="contexts-list")
+                selected = self._selected_contexts
+                yield SelectionList[str](
+                    *(
+                        Selection(f"@{ctx}", ctx, initial_state=ctx in selected)
+                        for ctx in self._contexts
+                    ),
+                    id="contexts-list",
+                )
 
                 yield Label("Projects", classes="list-label")
-                project_selections = [
-                    Selection(
-                        f"+{proj}",
-                        proj,
-                        initial_state=(proj in self._selected_projects),
-                    )
-                    for proj in self._projects
-                ]
-                yield SelectionList[str](*project_selections, id="projects-list")
+                selected = self._selected_projects
+                yield SelectionList[str](
+                    *(
+                        Selection(f"+{proj}", proj, initial_state=proj in selected)
+                        for proj in self._projects
+                    ),
+                    id="projects-list",
+                )
 
             with Horizontal():
                 yield Button("Apply", variant="primary", id="apply-btn")
@@ -90,8 +89,8 @@ class FilterScreen(ModalScreen[FilterResult | None]):
         projects_list = self.query_one("#projects-list", SelectionList)
 
         result = FilterResult(
-            contexts=list(contexts_list.selected),
-            projects=list(projects_list.selected),
+            contexts=tuple(contexts_list.selected),
+            projects=tuple(projects_list.selected),
         )
         self.dismiss(result)
 
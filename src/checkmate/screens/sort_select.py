@@ -11,15 +11,22 @@ from textual.widgets import Button, Footer, Label
 class SortSelectScreen(Screen):
     """Modal screen for selecting a sort attribute."""
 
-    BINDINGS: ClassVar[list] = [
-        ("escape", "cancel", "Cancel"),
-    ]
+    BINDINGS: ClassVar[tuple] = (("escape", "cancel", "Cancel"),)
+
+    # Map button IDs to sort attributes
+    _BUTTON_TO_ATTRIBUTE: ClassVar[dict[str, str]] = {
+        "sort-priority-btn": "priority",
+        "sort-context-btn": "context",
+        "sort-project-btn": "project",
+        "sort-due-btn": "due",
+        "sort-created-btn": "created",
+    }
 
     DEFAULT_CSS = """
     SortSelectScreen {
         background: $surface;
     }
-    
+
     SortSelectScreen > Container {
         width: auto;
         height: auto;
@@ -28,24 +35,24 @@ class SortSelectScreen(Screen):
         padding: 2 3;
         align: center middle;
     }
-    
+
     SortSelectScreen Label#title {
         width: 100%;
         text-align: center;
         text-style: bold;
         margin-bottom: 2;
     }
-    
+
     SortSelectScreen .button-group {
         width: 1fr;
         height: auto;
     }
-    
+
     SortSelectScreen Button {
         width: 100%;
         margin-bottom: 1;
     }
-    
+
     SortSelectScreen Button:last-of-type {
         margin-bottom: 0;
     }
@@ -78,19 +85,8 @@ class SortSelectScreen(Screen):
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
-        button_id = event.button.id
-
-        # Map button IDs to sort attributes
-        button_to_attribute = {
-            "sort-priority-btn": "priority",
-            "sort-context-btn": "context",
-            "sort-project-btn": "project",
-            "sort-due-btn": "due",
-            "sort-created-btn": "created",
-        }
-
-        if button_id in button_to_attribute:
-            attribute = button_to_attribute[button_id]
+        attribute = self._BUTTON_TO_ATTRIBUTE.get(event.button.id or "")
+        if attribute is not None:
             if self.callback:
                 self.callback(attribute)
             self.dismiss()
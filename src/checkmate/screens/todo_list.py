@@ -1,10 +1,13 @@
 """Main todo list screen."""
 
+import asyncio
 import logging
+from collections.abc import Collection
+from functools import partial
 from typing import TYPE_CHECKING, ClassVar, cast
 
 if TYPE_CHECKING:
-    from ..main import CheckmateApp
+    from ..app import CheckmateApp
 
 from textual.app import ComposeResult
 from textual.binding import Binding
@@ -14,10 +17,8 @@ from textual.screen import Screen
 from textual.widgets import Footer, Header
 
 from ..exceptions import TaskOperationError
+from ..models import Task
 from ..widgets.task_list import CompletedTaskList, TaskList
-from .confirm import ConfirmScreen
-from .create_task import CreateTaskScreen
-from .filter import FilterResult, FilterScreen
 
 logger = logging.getLogger(__name__)
 
@@ -25,36 +26,26 @@ logger = logging.getLogger(__name__)
 class SortCommandProvider(Provider):
     """Provider for task sorting commands."""
 
+    # (command name, sort attribute, help text)
+    _SORT_SPECS: ClassVar[tuple[tuple[str, str, str], ...]] = (
+        ("Sort by Priority", "priority", "Sort tasks by priority"),
+        ("Sort by Context", "context", "Sort tasks by context"),
+        ("Sort by Project", "project", "Sort tasks by project"),
+        ("Sort by Due Date", "due", "Sort tasks by due date"),
+        ("Sort by Created Date", "created", "Sort tasks by creation date"),
+    )
+
     async def discover(self) -> Hits:
         """Discover commands to show by default."""
         screen = cast("TodoListScreen", self.screen)
         task_list = screen.task_list
         if task_list:
-            yield DiscoveryHit(
-                "Sort by Priority",
-                lambda: task_list.apply_sort("priority"),
-                help="Sort tasks by priority",
-            )
-            yield DiscoveryHit(
-                "Sort by Context",
-                lambda: task_list.apply_sort("context"),
-                help="Sort tasks by context",
-            )
-            yield DiscoveryHit(
-                "Sort by Project",
-                lambda: task_list.apply_sort("project"),
-                help="Sort tasks by project",
-            )
-            yield DiscoveryHit(
-                "Sort by Due Date",
-                lambda: task_list.apply_sort("due"),
-                help="Sort tasks by due date",
-            )
-            yield DiscoveryHit(
-                "Sort by Created Date",
-                lambda: task_list.apply_sort("created"),
-                help="Sort tasks by creation date",
-            )
+            for name, attribute, help_text in self._SORT_SPECS:
+                yield DiscoveryHit(
+                    name,
+                    partial(task_list.apply_sort, attribute),
+                    help=help_text,
+                )
 
     async def search(self, query: str) -> Hits:
         """Search for commands."""
@@ -65,41 +56,13 @@ class SortCommandProvider(Provider):
         if not task_list:
             return
 
-        commands = [
-            (
-                "Sort by Priority",
-                lambda: task_list.apply_sort("priority"),
-                "Sort tasks by priority",
-            ),
-            (
-                "Sort by Context",
-                lambda: task_list.apply_sort("context"),
-                "Sort tasks by context",
-            ),
-            (
-                "Sort by Project",
-                lambda: task_list.apply_sort("project"),
-                "Sort tasks by project",
-            ),
-            (
-                "Sort by Due Date",
-                lambda: task_list.apply_sort("due"),
-                "Sort tasks by due date",
-            ),
-            (
-                "Sort by Created Date",
-                lambda: task_list.apply_sort("created"),
-                "Sort tasks by creation date",
-            ),
-        ]
-
-        for name, callback, help_text in commands:
+        for name, attribute, help_text in self._SORT_SPECS:
             score = matcher.match(name)
             if score > 0:
                 yield Hit(
                     score,
                     matcher.highlight(name),
-                    callback,
+                    partial(task_list.apply_sort, attribute),
                     help=help_text,
                 )
 
@@ -109,7 +72,7 @@ class TodoListScreen(Screen):
 
     COMMANDS: ClassVar[set] = {SortCommandProvider}
 
-    BINDINGS: ClassVar[list] = [
+    BINDINGS: ClassVar[tuple] = (
         ("a", "add_todo", "Add"),
         ("e", "edit_todo", "Edit"),
         ("d", "delete_todo", "Delete"),
@@ -121,7 +84,7 @@ class TodoListScreen(Screen):
         Binding("k", "cursor_up", "Up", show=False),
         Binding("1", "focus_todo", "Todo List", show=False),
         Binding("2", "focus_completed", "Done List", show=False),
-    ]
+    )
 
     def __init__(self):
         super().__init__()
@@ -143,53 +106,61 @@ class TodoListScreen(Screen):
 
     def action_cursor_down(self) -> None:
         """Move cursor down in the active list."""
-        if self.task_list and self.task_list.has_focus:
-            self.task_list.action_move_down()
-        elif self.completed_list and self.completed_list.has_focus:
-            self.completed_list.action_move_down()
+        self._move_cursor(1)
 
     def action_cursor_up(self) -> None:
         """Move cursor up in the active list."""
-        if self.task_list and self.task_list.has_focus:
-            self.task_list.action_move_up()
-        elif self.completed_list and self.completed_list.has_focus:
-            self.completed_list.action_move_up()
+        self._move_cursor(-1)
+
+    def _move_cursor(self, delta: int) -> None:
+        """Move the cursor in the focused list by `delta` rows."""
+        task_list, completed_list = self.task_list, self.completed_list
+        if task_list and task_list.has_focus:
+            task_list.move_focus_by(delta)
+        elif completed_list and completed_list.has_focus:
+            completed_list.move_focus_by(delta)
 
     def action_add_todo(self) -> None:
         """Show the task creation modal."""
+        from .create_task import CreateTaskScreen
+
+        self.app.push_screen(CreateTaskScreen(), callback=self._handle_modal_result)
+
+    def _handle_modal_result(self, result: dict | None) -> None:
+        """Report the outcome of the create/edit modal and refresh the list."""
+        if result and result.get("success"):
+            verb = "updated" if result.get("mode") == "edit" else "created"
+            self.app.notify(f"Task {verb}: {result.get('task')}", timeout=2.0)
+            if self.task_list:
+                self.task_list.schedule_refresh()
+        elif result and result.get("error"):
+            self.app.notify(
+                f"Error: {result.get('error')}", severity="error", timeout=5.0
+            )
 
-        def on_modal_result(result):
-            if result and result.get("success"):
-                self.app.notify(f"Task created: {result.get('task')}", timeout=2.0)
-                if self.task_list:
-                    self.task_list.refresh_tasks()
-            elif result and result.get("error"):
-                self.app.notify(
-                    f"Error: {result.get('error')}", severity="error", timeout=5.0
-                )
-
-        self.app.push_screen(CreateTaskScreen(), callback=on_modal_result)
-
-    def _delete_task(self) -> None:
-        """Helper to delete the task at cursor."""
-        if self.task_list and self.task_list.has_focus:
-            task = self.task_list.get_task_at_cursor()
+    async def _delete_task(self, task: Task | None = None) -> None:
+        """Helper to delete `task`, or the task at cursor if none is given."""
+        task_list, completed_list = self.task_list, self.completed_list
+        if task_list and task_list.has_focus:
+            if task is None:
+                task = task_list.get_task_at_cursor()
             if task:
                 try:
-                    self.task_list.delete_task_at_cursor()
+                    await task_list.delete_task(task)
                     self.app.notify(f"Task deleted: {task.description}", timeout=2.0)
                 except TaskOperationError as e:
                     self.app.notify(
                         f"Failed to delete task: {e}", severity="error", timeout=5.0
                     )
                 except Exception as e:
-                    logger.exception("Unexpected error deleting task")
+                    logger.error("Unexpected error deleting task: %s", e)
+                    logger.debug("Unexpected error deleting task", exc_info=True)
                     self.app.notify(
                         f"Unexpected error: {e}", severity="error", timeout=5.0
                     )
             else:
                 self.app.notify("No task selected", severity="warning", timeout=2.0)
-        elif self.completed_list and self.completed_list.has_focus:
+        elif completed_list and completed_list.has_focus:
             self.app.notify(
                 "Deleting completed tasks is not supported",
                 severity="warning",
@@ -198,13 +169,15 @@ class TodoListScreen(Screen):
 
     def action_delete_todo(self) -> None:
         """Delete the currently selected task with confirmation."""
-        if self.task_list and self.task_list.has_focus:
-            task = self.task_list.get_task_at_cursor()
+        task_list, completed_list = self.task_list, self.completed_list
+        if task_list and task_list.has_focus:
+            task = task_list.get_task_at_cursor()
             if task:
+                from .confirm import ConfirmScreen
 
-                def on_confirm(result: bool | None) -> None:
+                async def on_confirm(result: bool | None) -> None:
                     if result:
-                        self._delete_task()
+                        await self._delete_task(task)
 
                 self.app.push_screen(
                     ConfirmScreen(
@@ -217,44 +190,32 @@ class TodoListScreen(Screen):
                 )
             else:
                 self.app.notify("No task selected", severity="warning", timeout=2.0)
-        elif self.completed_list and self.completed_list.has_focus:
+        elif completed_list and completed_list.has_focus:
             self.app.notify(
                 "Deleting completed tasks is not supported",
                 severity="warning",
                 timeout=2.0,
             )
 
-    def action_force_delete_todo(self) -> None:
+    async def action_force_delete_todo(self) -> None:
         """Delete the currently selected task without confirmation."""
-        self._delete_task()
+        await self._delete_task()
 
     def action_edit_todo(self) -> None:
         """Edit the currently selected task."""
-        if self.task_list and self.task_list.has_focus:
-            task = self.task_list.get_task_at_cursor()
+        task_list, completed_list = self.task_list, self.completed_list
+        if task_list and task_list.has_focus:
+            task = task_list.get_task_at_cursor()
             if task:
-
-                def on_modal_result(result):
-                    if result and result.get("success"):
-                        self.app.notify(
-                            f"Task updated: {result.get('task')}", timeout=2.0
-                        )
-                        if self.task_list:
-                            self.task_list.refresh_tasks()
-                    elif result and result.get("error"):
-                        self.app.notify(
-                            f"Error: {result.get('error')}",
-                            severity="error",
-                            timeout=5.0,
-                        )
+                from .create_task import CreateTaskScreen
 
                 self.app.push_screen(
                     CreateTaskScreen(task=task),
-                    callback=on_modal_result,
+                    callback=self._handle_modal_result,
                 )
             else:
                 self.app.notify("No task selected", severity="warning", timeout=2.0)
-        elif self.completed_list and self.completed_list.has_focus:
+        elif completed_list and completed_list.has_focus:
             self.app.notify(
                 "Editing completed tasks is not supported",
                 severity="warning",
@@ -263,41 +224,50 @@ class TodoListScreen(Screen):
 
     def action_focus_todo(self) -> None:
         """Focus the todo list."""
-        if self.task_list:
-            self.task_list.focus()
+        task_list = self.task_list
+        if task_list:
+            task_list.focus()
 
     def action_focus_completed(self) -> None:
         """Focus the completed list if visible."""
-        if self.completed_list and self.completed_list.has_class("visible"):
-            self.completed_list.focus()
-        elif self.completed_list:
+        completed_list = self.completed_list
+        if completed_list and completed_list.has_class("visible"):
+            completed_list.focus()
+        elif completed_list:
             self.app.notify("Completed list is hidden", severity="warning", timeout=2.0)
 
     def action_toggle_completed(self) -> None:
         """Toggle visibility of completed tasks list."""
-        if self.completed_list:
-            if self.completed_list.has_class("visible"):
-                self.completed_list.remove_class("visible")
-            else:
-                self.completed_list.refresh_tasks()
-                self.completed_list.add_class("visible")
-
-    def action_filter(self) -> None:
+        completed_list = self.completed_list
+        if completed_list:
+            show = not completed_list.has_class("visible")
+            if show:
+                completed_list.refresh_tasks()
+            completed_list.set_class(show, "visible")
+
+    async def action_filter(self) -> None:
         """Open the filter screen."""
-        contexts = self.app.service.get_unique_contexts()
-        projects = self.app.service.get_unique_projects()
+        from .filter import FilterResult, FilterScreen
 
-        current_contexts: list[str] = []
-        current_projects: list[str] = []
-        if self.task_list:
-            current_contexts = list(self.task_list.filter_contexts)
-            current_projects = list(self.task_list.filter_projects)
+        app = self.app
+        # Collect the tags off the event loop; one scan yields both lists
+        contexts, projects = await asyncio.to_thread(
+            app.service.get_unique_contexts_and_projects
+        )
+        task_list = self.task_list
+
+        # The filter sets are frozen, so they can be handed over as they are
+        current_contexts: Collection[str] = ()
+        current_projects: Collection[str] = ()
+        if task_list:
+            current_contexts = task_list.filter_contexts
+            current_projects = task_list.filter_projects
 
         def on_filter_result(result: FilterResult | None) -> None:
-            if result is not None and self.task_list:
-                self.task_list.apply_filter(result.contexts, result.projects)
+            if result is not None and task_list:
+                task_list.apply_filter(result.contexts, result.projects)
 
-        self.app.push_screen(
+        app.push_screen(
             FilterScreen(
                 contexts=contexts,
                 projects=projects,
@@ -309,8 +279,9 @@ class TodoListScreen(Screen):
 
     def action_clear_filter(self) -> None:
         """Clear any active filter."""
-        if self.task_list and self.task_list.is_filtered:
-            self.task_list.clear_filter()
+        task_list = self.task_list
+        if task_list and task_list.is_filtered:
+            task_list.clear_filter()
             self.app.notify("Filter cleared", timeout=2.0)
         else:
             self.app.notify("No filter active", severity="warning", timeout=2.0)
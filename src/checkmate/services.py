@@ -1,18 +1,20 @@
 from datetime import date
+from itertools import chain
+from string import ascii_uppercase
 
 from .exceptions import TaskOperationError, TaskValidationError
 from .models import Task
 from .repository import TaskRepository, TaskRepositoryError
 
+_VALID_PRIORITIES = frozenset(ascii_uppercase)
+
 
 class TodoService:
     def __init__(self, repository: TaskRepository):
         self.repository = repository
 
     def _validate_priority(self, priority: str | None) -> None:
-        if priority and not (
-            len(priority) == 1 and priority.isalpha() and priority.isupper()
-        ):
+        if priority and priority not in _VALID_PRIORITIES:
             raise TaskValidationError("Priority must be a single uppercase letter A-Z")
 
     def get_active_tasks(self) -> list[Task]:
@@ -65,10 +67,13 @@ class TodoService:
         due_date: date | None = None,
     ) -> Task:
         """Update an existing task."""
+        description_changed = False
         if description is not None:
             if not description.strip():
                 raise TaskValidationError("Task description cannot be empty")
-            task.description = description
+            if description != task.description:
+                task.description = description
+                description_changed = True
 
         # Handle priority update (allow clearing it)
         # If priority passed is "", we clear it. If None, we keep it?
@@ -83,7 +88,7 @@ class TodoService:
             task.due_date = due_date
 
         # Recalculate projects/contexts if description changed
-        if description:
+        if description_changed:
             task.refresh_metadata()
 
         try:
@@ -115,16 +120,17 @@ class TodoService:
         except TaskRepositoryError as e:
             raise TaskOperationError(f"Failed to delete task: {e}") from e
 
+    def get_unique_contexts_and_projects(self) -> tuple[list[str], list[str]]:
+        """Get sorted unique @contexts and +projects from one fetch of active tasks."""
+        tasks = self.get_active_tasks()
+        contexts = set(chain.from_iterable(task.contexts for task in tasks))
+        projects = set(chain.from_iterable(task.projects for task in tasks))
+        return sorted(contexts), sorted(projects)
+
     def get_unique_contexts(self) -> list[str]:
         """Get sorted unique @contexts from active tasks."""
-        contexts: set[str] = set()
-        for task in self.get_active_tasks():
-            contexts.update(task.contexts)
-        return sorted(contexts)
+        return self.get_unique_contexts_and_projects()[0]
 
     def get_unique_projects(self) -> list[str]:
         """Get sorted unique +projects from active tasks."""
-        projects: set[str] = set()
-        for task in self.get_active_tasks():
-            projects.update(task.projects)
-        return sorted(projects)
+        return self.get_unique_contexts_and_projects()[1]
@@ -1,85 +1,156 @@
 """Task list display widget using Textual widgets."""
 
+import asyncio
 import logging
 import re
+from collections.abc import Callable, Iterable
+from datetime import date
+from functools import lru_cache
 from typing import TYPE_CHECKING, ClassVar, cast
 
 if TYPE_CHECKING:
-    from ..main import CheckmateApp
+    from ..app import CheckmateApp
 
-from textual.app import ComposeResult
+from textual.app import RenderResult
 from textual.binding import Binding
-from textual.containers import Horizontal, Vertical, VerticalScroll
+from textual.containers import VerticalScroll
+from textual.content import Content
 from textual.reactive import reactive
+from textual.style import Style
+from textual.timer import Timer
+from textual.widget import Widget
 from textual.widgets import Static
 
 from ..config import VALID_SORT_ATTRIBUTES as _VALID_SORT_ATTRIBUTES
 from ..config import save_config_value
 from ..exceptions import TaskOperationError
+from ..filter import TaskFilter
 from ..models import Task
 from ..services import TodoService
 
 logger = logging.getLogger(__name__)
 
+# Seconds to wait for more refresh requests before reloading a list
+_REFRESH_DELAY = 0.15
 
-def _extract_first_context(task: Task) -> str:
-    """Extract the first @context from a task description.
+# Date metadata tags hidden from the displayed description
+_METADATA_RE = re.compile(r"\s*(?:due|created|completed):\S+")
 
-    Returns empty string if no context found.
-    """
-    # Domain Task already extracts contexts
-    return task.contexts[0] if task.contexts else ""
+# @context and +project tags highlighted in the displayed description
+_TAG_RE = re.compile(r"[@+]\w+")
 
 
-def _extract_first_project(task: Task) -> str:
-    """Extract the first +project from a task description.
+# Sort keys read task fields inline: each runs once per task, so a nested
+# helper call would be most of its cost
+def _priority_sort_key(task: Task) -> tuple[bool, str]:
+    priority = task.priority
+    return (priority is None, priority or "")
 
-    Returns empty string if no project found.
-    """
-    # Domain Task already extracts projects
-    return task.projects[0] if task.projects else ""
 
+def _context_sort_key(task: Task) -> tuple[bool, str]:
+    contexts = task.contexts
+    return (False, contexts[0]) if contexts else (True, "")
 
-def _extract_due_date(task: Task) -> str:
-    """Extract due date from task attributes.
 
-    Returns empty string if not found.
-    """
-    if task.due_date:
-        return task.due_date.strftime("%Y-%m-%d")
-    return ""
+def _project_sort_key(task: Task) -> tuple[bool, str]:
+    projects = task.projects
+    return (False, projects[0]) if projects else (True, "")
 
 
-def get_active_tasks(service: TodoService):
-    """Get list of active tasks from service.
+def _due_sort_key(task: Task) -> tuple[bool, date | None]:
+    # Tasks without a due date share (True, None) and never compare the None
+    due = task.due_date
+    return (due is None, due)
 
-    Args:
-        service: TodoService instance.
 
-    Returns:
-        List of active Task objects.
-    """
-    return service.get_active_tasks()
+def _created_sort_key(task: Task) -> tuple[bool, date | None]:
+    created = task.creation_date
+    return (created is None, created)
+
+
+# Sort attribute -> key, each computing its task's value once; tasks lacking
+# the value sort last
+_SORT_KEYS: dict[str, Callable[[Task], tuple]] = {
+    "priority": _priority_sort_key,
+    "context": _context_sort_key,
+    "project": _project_sort_key,
+    "due": _due_sort_key,
+    "created": _created_sort_key,
+}
 
 
-def get_completed_tasks(service: TodoService):
-    """Get list of completed tasks from service.
+@lru_cache(maxsize=1024)
+def _description_segments(description: str) -> tuple[tuple[str, str | None], ...]:
+    """Split a description into display segments, minus date metadata tags.
 
-    Args:
-        service: TodoService instance.
+    Returns (text, css_class) pairs where css_class is "context", "project"
+    or None. Cached because every row is re-rendered on each reload.
+    """
+    # Most descriptions carry no metadata or tags; skip the regexes for those
+    if ":" in description:
+        description = _METADATA_RE.sub("", description)
+    description = description.strip()
+    if "@" not in description and "+" not in description:
+        return ((description, None),) if description else ()
+    segments: list[tuple[str, str | None]] = []
+    append = segments.append
+    start = 0
+    for match in _TAG_RE.finditer(description):
+        tag_start, tag_end = match.span()
+        if tag_start > start:
+            append((description[start:tag_start], None))
+        tag = description[tag_start:tag_end]
+        append((tag, "context" if tag[0] == "@" else "project"))
+        start = tag_end
+    if start < len(description):
+        append((description[start:], None))
+    return tuple(segments)
+
+
+def _due_class(task: Task) -> str:
+    """Return the CSS class for the due date of a task that has one."""
+    if task.is_overdue:
+        return "due-overdue"
+    if task.is_due_today:
+        return "due-today"
+    return "due-future"
+
+
+def _display_key(task: Task) -> tuple[str, str, str, str, str, str]:
+    """Return everything a TaskRow shows for `task`, to detect changes.
 
     Returns:
-        List of completed Task objects.
+        (priority, description, created, completed, due, due CSS class),
+        each "" when absent.
     """
-    return service.get_completed_tasks()
+    due = task.display_due
+    return (
+        task.priority or "",
+        task.description,
+        task.display_created,
+        task.display_completed,
+        due,
+        _due_class(task) if due else "",
+    )
 
 
 class TaskRow(Static):
     """
     Single task row widget displaying task information across lines
     with wrapped description.
+
+    The row renders its own text rather than composing a widget per
+    segment; component classes style the tags and due dates.
     """
 
+    COMPONENT_CLASSES: ClassVar[set[str]] = {
+        "task-row--context",
+        "task-row--project",
+        "task-row--due-overdue",
+        "task-row--due-today",
+        "task-row--due-future",
+    }
+
     DEFAULT_CSS = """
     TaskRow {
         height: auto;
@@ -89,174 +160,250 @@ class TaskRow(Static):
         border: none;
     }
 
-    TaskRow > Vertical {
-        height: auto;
-        width: 100%;
-    }
-
-    TaskRow .description-line {
-        width: 100%;
-        height: auto;
-    }
-
-    TaskRow .description-segment {
-        width: auto;
-        height: auto;
-    }
-
-    TaskRow .context {
+    TaskRow > .task-row--context {
         color: $secondary;
     }
 
-    TaskRow .project {
+    TaskRow > .task-row--project {
         color: $warning;
     }
 
-    TaskRow .metadata-line {
-        width: 100%;
-        height: auto;
-        padding-left: 4;
-    }
-
-    TaskRow .metadata-segment {
-        width: auto;
-        height: auto;
-    }
-
-    TaskRow .due-overdue {
+    TaskRow > .task-row--due-overdue {
         color: $error;
     }
 
-    TaskRow .due-today {
+    TaskRow > .task-row--due-today {
         color: $warning;
     }
 
-    TaskRow .due-future {
+    TaskRow > .task-row--due-future {
         color: $success;
     }
     """
 
-    def __init__(self, task, max_width: int | None = None, **kwargs):
+    def __init__(self, task, **kwargs):
         super().__init__(**kwargs)
         self._todo_task = task
-        self.max_width = max_width
+        # What the last render displayed; tasks may be edited in place
+        self._shown: tuple[str, ...] | None = None
 
     @property
     def task(self):
         """Get the todo task object."""
         return self._todo_task
 
-    def _extract_due_date(self) -> str:
-        """Extract due date from task attributes."""
-        if self._todo_task.due_date:
-            return self._todo_task.due_date.strftime("%Y-%m-%d")
-        return ""
+    def rebind(self, task) -> None:
+        """Show `task` in this row, re-rendering only if its display changes."""
+        self._todo_task = task
+        if _display_key(task) != self._shown:
+            self.clear_cached_dimensions()
+            self.refresh(layout=True)
+
+    def render(self) -> RenderResult:
+        """Render the description line and, if any dates, the metadata line."""
+        # The change-detection key doubles as the values to show, so each
+        # date string and the due status are worked out once per render
+        shown = self._shown = _display_key(self._todo_task)
+        priority, description, created, completed, due, due_class = shown
+        style = self.get_visual_style
+
+        parts: list[str | Content | tuple[str, Style]] = []
+        if priority:
+            parts.append(f"[{priority}] ")
+        for text, css_class in _description_segments(description):
+            if css_class:
+                parts.append((text, style(f"task-row--{css_class}", partial=True)))
+            else:
+                parts.append(text)
+
+        metadata: list[str | Content] = []
+        if created:
+            metadata.append("Created: " + created)
+        if due:
+            due_style = style(f"task-row--{due_class}", partial=True)
+            metadata.append(Content.styled("Due: " + due, due_style))
+        if completed:
+            metadata.append("Completed: " + completed)
+        if metadata:
+            parts.append("\n    ")
+            parts.append(Content(" | ").join(metadata))
+
+        return Content.assemble(*parts)
+
+
+def _rebind_rows(
+    parent: Widget, rows: list[TaskRow], tasks: list[Task]
+) -> list[TaskRow]:
+    """Show `tasks` in `parent`, reusing its existing `rows` in order.
+
+    Reused rows only recompose if their task displays differently; extra
+    tasks get new rows and leftover rows are removed.
+
+    Returns:
+        The rows now showing `tasks`, in order.
+    """
+    reused = rows[: len(tasks)]
+    for row, task in zip(reused, tasks, strict=False):
+        row.rebind(task)
+    leftover = rows[len(tasks) :]
+    if leftover:
+        parent.remove_children(leftover)
+    added = [TaskRow(task) for task in tasks[len(reused) :]]
+    if added:
+        parent.mount_all(added)
+    return reused + added
+
+
+class _BaseTaskList(VerticalScroll):
+    """Scrollable list of task rows with a keyboard-driven cursor.
+
+    Shared by TaskList and CompletedTaskList, which name the service method
+    their tasks load from and, for TaskList, pick the subset to show.
+    """
+
+    # The service method that loads this list's tasks
+    _LOAD_TASKS: ClassVar[Callable[[TodoService], list[Task]]]
+
+    BINDINGS: ClassVar[list] = [
+        Binding("down", "move_down", "Down", show=False),
+        Binding("up", "move_up", "Up", show=False),
+    ]
+
+    focused_task_index = reactive(0)
+    can_focus = True
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # A plain attribute: as a reactive, each load or sort would deep-compare
+        # the old and new task lists only to trigger a repaint we do ourselves
+        self.tasks: list[Task] = []
+        self._initialized = False
+        self._refresh_timer: Timer | None = None
+        self._focus_styling_pending = False
+        # Mounted rows in display order, and the row styled as focused
+        self._rows: list[TaskRow] = []
+        self._styled_row: TaskRow | None = None
+
+    @property
+    def app(self) -> CheckmateApp:
+        return cast("CheckmateApp", super().app)
+
+    def _visible_tasks(self) -> list[Task]:
+        """Return the loaded tasks that should be shown, in order."""
+        return self.tasks
+
+    def refresh_tasks(self) -> None:
+        """Load tasks from file and refresh display."""
+        self._cancel_scheduled_refresh()
+        self.tasks = type(self)._LOAD_TASKS(self.app.service)
+        self.rebuild_layout()
+
+    def schedule_refresh(self) -> None:
+        """Refresh shortly, coalescing a burst of requests into one reload."""
+        self._cancel_scheduled_refresh()
+        self._refresh_timer = self.set_timer(_REFRESH_DELAY, self.refresh_tasks)
 
-    def _strip_metadata_from_description(self, description: str) -> str:
-        """Remove metadata tags (due:, priority:, etc.) from description."""
-        if not description:
-            return ""
+    def _cancel_scheduled_refresh(self) -> None:
+        if self._refresh_timer is not None:
+            self._refresh_timer.stop()
+            self._refresh_timer = None
 
-        description = re.sub(r"\s*due:\S+", "", description)
-        description = re.sub(r"\s*created:\S+", "", description)
-        description = re.sub(r"\s*completed:\S+", "", description)
+    def rebuild_layout(self, visible: list[Task] | None = None) -> None:
+        """Rebuild task rows, applying any active filter.
 
-        return description.strip()
+        Args:
+            visible: The tasks to show, if already computed.
+        """
+        if visible is None:
+            visible = self._visible_tasks()
 
-    def _parse_description(self, description: str):
-        """Parse description into segments with CSS classes.
+        with self.app.batch_update():
+            # Reuse the mounted rows, mounting or removing only the difference
+            self._rows = _rebind_rows(self, self._rows, visible)
 
-        Yields tuples of (text, css_class) where css_class may be None.
+            # Update focus styling
+            self._update_focus_styling()
+
+    def _update_focus_styling(self) -> None:
+        """Move the focused CSS class to the row at the cursor.
+
+        Only the previously styled row and the new one change class.
         """
-        if not description:
+        rows = self._rows
+        index = self.focused_task_index
+        row = rows[index] if 0 <= index < len(rows) else None
+        styled = self._styled_row
+        if row is styled:
             return
+        if styled is not None:
+            styled.remove_class("focused")
+        if row is not None:
+            row.add_class("focused")
+        self._styled_row = row
+
+    def watch_focused_task_index(self, _index: int) -> None:
+        """Update focus styling after the next refresh when index changes.
+
+        Rapid key repeats then restyle the rows once per frame.
+        """
+        if not self._focus_styling_pending:
+            self._focus_styling_pending = True
+            self.call_after_refresh(self._flush_focus_styling)
+
+    def _flush_focus_styling(self) -> None:
+        self._focus_styling_pending = False
+        self._update_focus_styling()
+
+    def get_task_at_cursor(self):
+        """Get the Task object at the current cursor position.
+
+        The cursor indexes the shown rows, which a filter may make fewer
+        than the loaded tasks.
+
+        Returns:
+            Task object if cursor is on a valid row, None otherwise.
+        """
+        rows = self._rows
+        if 0 <= self.focused_task_index < len(rows):
+            return rows[self.focused_task_index].task
+        return None
+
+    def move_focus_down(self) -> None:
+        """Move focus to next task."""
+        if self.focused_task_index < len(self._rows) - 1:
+            self.focused_task_index += 1
+
+    def move_focus_up(self) -> None:
+        """Move focus to previous task."""
+        if self.focused_task_index > 0:
+            self.focused_task_index -= 1
+
+    def move_focus_by(self, delta: int) -> None:
+        """Move focus by `delta` tasks at once, stopping at either end."""
+        index = self.focused_task_index
+        if delta > 0:
+            index = min(index + delta, max(index, len(self._rows) - 1))
+        else:
+            index = max(index + delta, min(index, 0))
+        self.focused_task_index = index
+
+    def action_move_down(self) -> None:
+        """Action handler for down key."""
+        self.move_focus_down()
 
-        i = 0
-        current_text = ""
-
-        while i < len(description):
-            if description[i] == "@":
-                match = re.match(r"@\w+", description[i:])
-                if match:
-                    if current_text:
-                        yield (current_text, None)
-                        current_text = ""
-                    yield (match.group(0), "context")
-                    i += len(match.group(0))
-                    continue
-
-            if description[i] == "+":
-                match = re.match(r"\+\w+", description[i:])
-                if match:
-                    if current_text:
-                        yield (current_text, None)
-                        current_text = ""
-                    yield (match.group(0), "project")
-                    i += len(match.group(0))
-                    continue
-
-            current_text += description[i]
-            i += 1
-
-        if current_text:
-            yield (current_text, None)
-
-    def compose(self) -> ComposeResult:
-        """Compose the task row with styled widgets."""
-        task = self._todo_task
-
-        priority = task.priority if task.priority else ""
-        created = str(task.creation_date) if task.creation_date else ""
-        completed = str(task.completion_date) if task.completion_date else ""
-        due = self._extract_due_date()
-        description = (
-            self._strip_metadata_from_description(task.description)
-            if task.description
-            else ""
-        )
-
-        with Vertical():
-            with Horizontal(classes="description-line"):
-                if priority:
-                    yield Static(f"[{priority}] ", classes="description-segment")
-
-                for text, css_class in self._parse_description(description):
-                    classes = "description-segment"
-                    if css_class:
-                        classes += f" {css_class}"
-                    yield Static(text, classes=classes)
-
-            metadata_parts = []
-            if created:
-                metadata_parts.append(("Created: " + created, None))
-            if due:
-                if task.is_overdue:
-                    due_class = "due-overdue"
-                elif task.is_due_today:
-                    due_class = "due-today"
-                else:
-                    due_class = "due-future"
-                metadata_parts.append(("Due: " + due, due_class))
-            if completed:
-                metadata_parts.append(("Completed: " + completed, None))
-
-            if metadata_parts:
-                with Horizontal(classes="metadata-line"):
-                    for i, (text, css_class) in enumerate(metadata_parts):
-                        if i > 0:
-                            yield Static(" | ", classes="metadata-segment")
-                        classes = "metadata-segment"
-                        if css_class:
-                            classes += f" {css_class}"
-                        yield Static(text, classes=classes)
-
-
-class TaskList(VerticalScroll):
+    def action_move_up(self) -> None:
+        """Action handler for up key."""
+        self.move_focus_up()
+
+
+class TaskList(_BaseTaskList):
     """Container displaying a scrollable list of incomplete tasks.
 
     Supports keyboard navigation and deletion. Responds to terminal resize.
     """
 
+    _LOAD_TASKS = TodoService.get_active_tasks
+
     DEFAULT_CSS = """
     TaskList {
         height: 1fr;
@@ -288,68 +435,58 @@ class TaskList(VerticalScroll):
         color: $text;
     }
 
-    TaskList > TaskRow.focused .context {
+    TaskList > TaskRow.focused > .task-row--context {
         color: $text;
     }
 
-    TaskList > TaskRow.focused .project {
+    TaskList > TaskRow.focused > .task-row--project {
         color: $text;
     }
     """
 
     BINDINGS: ClassVar[list] = [
-        Binding("down", "move_down", "Down", show=False),
-        Binding("up", "move_up", "Up", show=False),
         Binding("delete", "delete", "Delete", show=False),
         Binding("s", "sort", "Sort"),
         Binding("x", "complete_todo", "Complete Todo"),
     ]
 
-    tasks = reactive([])
-    focused_task_index = reactive(0)
-    can_focus = True
-
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self._initialized = False
-        self._filter_contexts: set[str] = set()
-        self._filter_projects: set[str] = set()
+        self._filter = TaskFilter()
 
     @property
-    def filter_contexts(self) -> set[str]:
+    def filter_contexts(self) -> frozenset[str]:
         """Get the current context filter."""
-        return self._filter_contexts
+        return self._filter.contexts
 
     @property
-    def filter_projects(self) -> set[str]:
+    def filter_projects(self) -> frozenset[str]:
         """Get the current project filter."""
-        return self._filter_projects
+        return self._filter.projects
 
     @property
     def is_filtered(self) -> bool:
         """Return True if any filter is active."""
-        return bool(self._filter_contexts or self._filter_projects)
+        return self._filter.is_active
 
-    def apply_filter(self, contexts: list[str], projects: list[str]) -> None:
+    def apply_filter(self, contexts: Iterable[str], projects: Iterable[str]) -> None:
         """Apply filter by contexts and/or projects.
 
         Args:
-            contexts: List of context names to filter by (OR logic).
-            projects: List of project names to filter by (OR logic).
+            contexts: Context names to filter by (OR logic).
+            projects: Project names to filter by (OR logic).
         """
-        self._filter_contexts = set(contexts)
-        self._filter_projects = set(projects)
+        self._filter = TaskFilter(frozenset(contexts), frozenset(projects))
         self._update_filtered_class()
         if self._initialized:
-            self.rebuild_layout()
+            self._refilter()
 
     def clear_filter(self) -> None:
         """Clear all filters."""
-        self._filter_contexts = set()
-        self._filter_projects = set()
+        self._filter = TaskFilter()
         self._update_filtered_class()
         if self._initialized:
-            self.rebuild_layout()
+            self._refilter()
 
     def _update_filtered_class(self) -> None:
         """Update the 'filtered' CSS class based on filter state."""
@@ -358,35 +495,6 @@ class TaskList(VerticalScroll):
         else:
             self.remove_class("filtered")
 
-    def _task_matches_filter(self, task: Task) -> bool:
-        """Check if a task matches the current filter.
-
-        Returns True if:
-        - No filter is active (both sets empty)
-        - Task has ANY matching context OR ANY matching project
-        """
-        if not self.is_filtered:
-            return True
-
-        # Check if task has any matching context
-        if self._filter_contexts:
-            task_contexts = set(task.contexts)
-            if task_contexts & self._filter_contexts:
-                return True
-
-        # Check if task has any matching project
-        if self._filter_projects:
-            task_projects = set(task.projects)
-            if task_projects & self._filter_projects:
-                return True
-
-        # If filter is active but no match found
-        return False
-
-    @property
-    def app(self) -> CheckmateApp:
-        return cast("CheckmateApp", super().app)
-
     def on_mount(self) -> None:
         """Initialize on mount."""
         self._initialized = True
@@ -396,97 +504,51 @@ class TaskList(VerticalScroll):
         if sort_attr in _VALID_SORT_ATTRIBUTES:
             self.apply_sort(sort_attr, persist=False)
 
-    def on_resize(self, _event) -> None:
-        """Handle terminal resize."""
-        if self._initialized:
-            self.rebuild_layout()
-
-    def refresh_tasks(self) -> None:
-        """Load tasks from file and refresh display."""
-        self.tasks = get_active_tasks(self.app.service)
-        self.rebuild_layout()
-
-    def rebuild_layout(self) -> None:
-        """Rebuild task rows with current width, applying any active filter."""
-        # Clear existing rows
-        rows = self.query(TaskRow)
-        if rows:
-            rows.remove()
+    def _visible_tasks(self) -> list[Task]:
+        return self._filter.select(self.tasks)
 
-        # Calculate width (use current width or fallback)
-        width = self.size.width if self.size.width > 0 else 80
+    def _refilter(self) -> None:
+        """Rebuild rows for a filter change, unless the same tasks stay shown.
 
-        # Add task rows (filtered)
-        for task in self.tasks:
-            if self._task_matches_filter(task):
-                row = TaskRow(task, max_width=width)
-                self.mount(row)
-
-        # Update focus styling
-        self._update_focus_styling()
-
-    def _update_focus_styling(self) -> None:
-        """Update CSS class for focused row."""
-        rows = self.query(TaskRow)
-        for i, row in enumerate(rows):
-            if i == self.focused_task_index:
-                row.add_class("focused")
-            else:
-                row.remove_class("focused")
-
-    def watch_focused_task_index(self, _index: int) -> None:
-        """Update focus styling when index changes."""
-        self._update_focus_styling()
-
-    def get_task_at_cursor(self):
-        """Get the Task object at the current cursor position.
-
-        Returns:
-            Task object if cursor is on a valid row, None otherwise.
+        Only filter changes skip; a reload may have edited tasks in place.
         """
-        if 0 <= self.focused_task_index < len(self.tasks):
-            return self.tasks[self.focused_task_index]
-        return None
+        visible = self._visible_tasks()
+        if len(visible) == len(self._rows) and all(
+            row.task is task for row, task in zip(self._rows, visible, strict=True)
+        ):
+            return
+        self.rebuild_layout(visible)
 
-    def delete_task_at_cursor(self) -> None:
+    async def delete_task_at_cursor(self) -> None:
         """Delete the task at the current cursor position.
 
         Raises:
             TaskOperationError: If deletion fails.
         """
         task = self.get_task_at_cursor()
-        if not task:
-            return
-
-        self.app.service.delete_task(task)
-        self.refresh_tasks()
-
-    def move_focus_down(self) -> None:
-        """Move focus to next task."""
-        if self.focused_task_index < len(self.tasks) - 1:
-            self.focused_task_index += 1
+        if task:
+            await self.delete_task(task)
 
-    def move_focus_up(self) -> None:
-        """Move focus to previous task."""
-        if self.focused_task_index > 0:
-            self.focused_task_index -= 1
+    async def delete_task(self, task: Task) -> None:
+        """Delete a task and refresh the list.
 
-    def action_move_down(self) -> None:
-        """Action handler for down key."""
-        self.move_focus_down()
+        The repository write runs in a worker thread so the UI stays responsive.
 
-    def action_move_up(self) -> None:
-        """Action handler for up key."""
-        self.move_focus_up()
+        Raises:
+            TaskOperationError: If deletion fails.
+        """
+        await asyncio.to_thread(self.app.service.delete_task, task)
+        self.refresh_tasks()
 
-    def action_delete(self) -> None:
+    async def action_delete(self) -> None:
         """Action handler for delete key."""
         try:
-            self.delete_task_at_cursor()
+            await self.delete_task_at_cursor()
         except TaskOperationError as e:
             self.app.notify(f"Failed to delete task: {e}", severity="error")
         except Exception as e:
-            logger.exception("Unexpected error deleting task")
+            logger.error("Unexpected error deleting task: %s", e)
+            logger.debug("Unexpected error deleting task", exc_info=True)
             self.app.notify(f"Unexpected error: {e}", severity="error")
 
     def action_sort(self) -> None:
@@ -499,20 +561,20 @@ class TaskList(VerticalScroll):
 
         self.app.push_screen(SortSelectScreen(callback=on_sort_selected))
 
-    def action_complete_todo(self) -> None:
+    async def action_complete_todo(self) -> None:
         """Action handler for complete todo key."""
         task = self.get_task_at_cursor()
         if task:
             try:
-                self.app.service.complete_task(task)
+                await asyncio.to_thread(self.app.service.complete_task, task)
                 self.app.notify(f"Task completed: {task.description}", timeout=2.0)
                 self.refresh_tasks()
-                # Refresh completed list
+                # Refresh completed list once a run of completions settles
                 try:
                     completed_list = cast(
                         "CompletedTaskList", self.screen.query_one("#completed-list")
                     )
-                    completed_list.refresh_tasks()
+                    completed_list.schedule_refresh()
                 except Exception:
                     pass
             except TaskOperationError as e:
@@ -520,7 +582,8 @@ class TaskList(VerticalScroll):
                     f"Failed to complete task: {e}", severity="error", timeout=5.0
                 )
             except Exception as e:
-                logger.exception("Unexpected error completing task")
+                logger.error("Unexpected error completing task: %s", e)
+                logger.debug("Unexpected error completing task", exc_info=True)
                 self.app.notify(f"Unexpected error: {e}", severity="error", timeout=5.0)
         else:
             self.app.notify("No task selected", severity="warning", timeout=2.0)
@@ -533,53 +596,34 @@ class TaskList(VerticalScroll):
                 'created'
             persist: Whether to save the sort preference to config
         """
-        if attribute == "priority":
-            self.tasks = sorted(
-                self.tasks, key=lambda t: (t.priority is None, t.priority or "")
-            )
-        elif attribute == "context":
-            self.tasks = sorted(
-                self.tasks,
-                key=lambda t: (
-                    _extract_first_context(t) == "",
-                    _extract_first_context(t),
-                ),
-            )
-        elif attribute == "project":
-            self.tasks = sorted(
-                self.tasks,
-                key=lambda t: (
-                    _extract_first_project(t) == "",
-                    _extract_first_project(t),
-                ),
-            )
-        elif attribute == "due":
-            self.tasks = sorted(
-                self.tasks,
-                key=lambda t: (_extract_due_date(t) == "", _extract_due_date(t)),
-            )
-        elif attribute == "created":
-            self.tasks = sorted(
-                self.tasks,
-                key=lambda t: (
-                    t.creation_date is None,
-                    str(t.creation_date) if t.creation_date else "",
-                ),
-            )
-
-        # Rebuild layout to show sorted tasks
-        self.rebuild_layout()
+        sort_key = _SORT_KEYS.get(attribute)
+        if sort_key is not None:
+            self.tasks = sorted(self.tasks, key=sort_key)
+
+        # Reorder the existing rows to match instead of remounting them; rows
+        # still pending removal from an earlier rebuild sort to the end
+        order = {id(task): i for i, task in enumerate(self.tasks)}
+
+        def row_position(row) -> int:
+            return order.get(id(cast("TaskRow", row).task), len(order))
+
+        self._rows.sort(key=row_position)
+        with self.app.batch_update():
+            self.sort_children(key=row_position)
+            self._update_focus_styling()
 
         if persist:
             save_config_value("SORT_ATTRIBUTE", attribute)
 
 
-class CompletedTaskList(VerticalScroll):
+class CompletedTaskList(_BaseTaskList):
     """Container displaying a scrollable list of completed tasks from done.txt.
 
     Similar to TaskList but read-only, displays only completed tasks.
     """
 
+    _LOAD_TASKS = TodoService.get_completed_tasks
+
     DEFAULT_CSS = """
     CompletedTaskList {
         height: 1fr;
@@ -608,33 +652,31 @@ class CompletedTaskList(VerticalScroll):
         color: $text;
     }
 
-    CompletedTaskList > TaskRow.focused .context {
+    CompletedTaskList > TaskRow.focused > .task-row--context {
         color: $text;
     }
 
-    CompletedTaskList > TaskRow.focused .project {
+    CompletedTaskList > TaskRow.focused > .task-row--project {
         color: $text;
     }
     """
 
     BINDINGS: ClassVar[list] = [
-        Binding("down", "move_down", "Down", show=False),
-        Binding("up", "move_up", "Up", show=False),
         Binding("r", "reopen_todo", "Reopen Todo"),
     ]
 
-    def action_reopen_todo(self) -> None:
+    async def action_reopen_todo(self) -> None:
         """Action handler for reopen todo key."""
         task = self.get_task_at_cursor()
         if task:
             try:
-                self.app.service.reopen_task(task)
+                await asyncio.to_thread(self.app.service.reopen_task, task)
                 self.app.notify(f"Task reopened: {task.description}", timeout=2.0)
                 self.refresh_tasks()
-                # Refresh active list
+                # Refresh active list once a run of reopens settles
                 try:
                     task_list = cast("TaskList", self.screen.query_one("#task-list"))
-                    task_list.refresh_tasks()
+                    task_list.schedule_refresh()
                 except Exception:
                     pass
             except TaskOperationError as e:
@@ -642,93 +684,13 @@ class CompletedTaskList(VerticalScroll):
                     f"Failed to reopen task: {e}", severity="error", timeout=5.0
                 )
             except Exception as e:
-                logger.exception("Unexpected error reopening task")
+                logger.error("Unexpected error reopening task: %s", e)
+                logger.debug("Unexpected error reopening task", exc_info=True)
                 self.app.notify(f"Unexpected error: {e}", severity="error", timeout=5.0)
         else:
             self.app.notify("No task selected", severity="warning", timeout=2.0)
 
-    tasks = reactive([])
-    focused_task_index = reactive(0)
-    can_focus = True
-
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self._initialized = False
-
-    @property
-    def app(self) -> CheckmateApp:
-        return cast("CheckmateApp", super().app)
-
     def on_mount(self) -> None:
         """Initialize on mount."""
         self._initialized = True
         self.refresh_tasks()
-
-    def on_resize(self, _event) -> None:
-        """Handle terminal resize."""
-        if self._initialized:
-            self.rebuild_layout()
-
-    def refresh_tasks(self) -> None:
-        """Load tasks from file and refresh display."""
-        self.tasks = get_completed_tasks(self.app.service)
-        self.rebuild_layout()
-
-    def rebuild_layout(self) -> None:
-        """Rebuild task rows with current width."""
-        # Clear existing rows
-        rows = self.query(TaskRow)
-        if rows:
-            rows.remove()
-
-        # Calculate width (use current width or fallback)
-        width = self.size.width if self.size.width > 0 else 80
-
-        # Add task rows
-        for task in self.tasks:
-            row = TaskRow(task, max_width=width)
-            self.mount(row)
-
-        # Update focus styling
-        self._update_focus_styling()
-
-    def _update_focus_styling(self) -> None:
-        """Update CSS class for focused row."""
-        rows = self.query(TaskRow)
-        for i, row in enumerate(rows):
-            if i == self.focused_task_index:
-                row.add_class("focused")
-            else:
-                row.remove_class("focused")
-
-    def watch_focused_task_index(self, _index: int) -> None:
-        """Update focus styling when index changes."""
-        self._update_focus_styling()
-
-    def get_task_at_cursor(self):
-        """Get the Task object at the current cursor position.
-
-        Returns:
-            Task object if cursor is on a valid row, None otherwise.
-        """
-        if 0 <= self.focused_task_index < len(self.tasks):
-            return self.tasks[self.focused_task_index]
-        return None
-
-    def move_focus_down(self) -> None:
-        """Move focus to next task."""
-        if self.focused_task_index < len(self.tasks) - 1:
-            self.focused_task_index += 1
-
-    def move_focus_up(self) -> None:
-        """Move focus to previous task."""
-        if self.focused_task_index > 0:
-            self.focused_task_index -= 1
-
-    def action_move_down(self) -> None:
-        """Action handler for down key."""
-        self.move_focus_down()
-
-    def action_move_up(self) -> None:
-        """Action handler for up key."""
-        self.move_focus_up()
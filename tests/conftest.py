@@ -0,0 +1,114 @@
+"""Shared pytest fixtures."""
+
+import asyncio
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+import pytest
+
+from checkmate.models import Task
+from checkmate.repository import TaskRepository
+from checkmate.services import TodoService
+
+if TYPE_CHECKING:
+    from textual.pilot import Pilot
+
+
+class InMemoryTaskRepository(TaskRepository):
+    """Repository holding tasks in a list, for tests of logic above storage."""
+
+    def __init__(self):
+        self.tasks: list[Task] = []
+
+    def get_active_tasks(self) -> list[Task]:
+        return [task for task in self.tasks if not task.is_completed]
+
+    def get_completed_tasks(self) -> list[Task]:
+        return [task for task in self.tasks if task.is_completed]
+
+    def save(self, task: Task) -> None:
+        if not any(stored is task for stored in self.tasks):
+            self.tasks.append(task)
+
+    def delete(self, task: Task) -> None:
+        self.tasks = [stored for stored in self.tasks if stored is not task]
+
+
+@pytest.fixture
+def memory_repository():
+    return InMemoryTaskRepository()
+
+
+@pytest.fixture
+def service(memory_repository):
+    return TodoService(memory_repository)
+
+
+@pytest.fixture
+def run_list_app(service):
+    """Run an app showing a single task list widget of the given class.
+
+    Returns the app's `run_test()` context manager; the app serves `service`
+    and an empty config, as the widgets expect of CheckmateApp.
+    """
+    from textual.app import App
+
+    def run(list_class):
+        class ListApp(App):
+            def __init__(self):
+                super().__init__()
+                self.service = service
+                self.config = {}
+
+            def compose(self):
+                yield list_class()
+
+        return ListApp().run_test()
+
+    return run
+
+
+@pytest.fixture(scope="session", autouse=True)
+async def _no_leaked_tasks():
+    """Fail the run if tests leave tasks pending on the shared event loop."""
+    yield
+    leaked = asyncio.all_tasks() - {asyncio.current_task()}
+    assert not leaked, f"tasks left pending after the test session: {leaked}"
+
+
+@pytest.fixture(scope="module")
+async def screen_app():
+    """One running app per module, reused by every screen test in it."""
+    # Imported here so modules without UI tests never load Textual
+    from textual.app import App
+
+    app = App()
+    async with app.run_test() as pilot:
+        yield app, pilot
+
+
+@pytest.fixture
+async def filter_app(screen_app):
+    """The shared app, popped back to its default screen after each test."""
+    app, pilot = screen_app
+    yield app, pilot
+    await pilot.pause()
+    while len(app.screen_stack) > 1:
+        await app.pop_screen()
+
+
+async def _wait_until(
+    predicate: Callable[[], object], pilot: Pilot, timeout: float = 0.5
+) -> None:
+    """Yield to the app until `predicate` holds, instead of a fixed pause."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"condition not met within {timeout}s")
+        await pilot.pause(0)
+
+
+@pytest.fixture
+def wait_until():
+    return _wait_until
@@ -1,6 +1,13 @@
 """Tests for config persistence."""
 
-from checkmate.config import VALID_SORT_ATTRIBUTES, load_config, save_config_value
+from checkmate import config as config_module
+from checkmate.config import (
+    VALID_SORT_ATTRIBUTES,
+    discover_files,
+    load_config,
+    load_config_file,
+    save_config_value,
+)
 
 
 def test_save_config_value_creates_file(tmp_path):
@@ -59,3 +66,116 @@ def test_save_config_value_preserves_comments(tmp_path):
 def test_valid_sort_attributes_contains_expected_values():
     """VALID_SORT_ATTRIBUTES contains all expected sort attributes."""
     assert VALID_SORT_ATTRIBUTES == {"priority", "context", "project", "due", "created"}
+
+
+def test_load_config_file_missing_returns_empty(tmp_path):
+    """load_config_file returns an empty dict when no config exists."""
+    assert load_config_file(home_dir=str(tmp_path)) == {}
+
+
+def test_load_config_file_returns_independent_copies(tmp_path):
+    """Mutating a returned config does not leak into later loads."""
+    save_config_value("TODO_FILE", "/home/user/todo.txt", home_dir=str(tmp_path))
+
+    first = load_config_file(home_dir=str(tmp_path))
+    first["TODO_FILE"] = "changed"
+
+    second = load_config_file(home_dir=str(tmp_path))
+    assert second["TODO_FILE"] == "/home/user/todo.txt"
+
+
+def test_load_config_file_sees_saved_values(tmp_path):
+    """A cached config is invalidated by save_config_value."""
+    save_config_value("SORT_ATTRIBUTE", "due", home_dir=str(tmp_path))
+    assert load_config_file(home_dir=str(tmp_path))["SORT_ATTRIBUTE"] == "due"
+
+    save_config_value("SORT_ATTRIBUTE", "priority", home_dir=str(tmp_path))
+    assert load_config_file(home_dir=str(tmp_path))["SORT_ATTRIBUTE"] == "priority"
+
+
+def test_save_config_value_updates_only_first_match(tmp_path):
+    """save_config_value rewrites the first matching key and leaves no temp file."""
+    config_dir = tmp_path / ".todo"
+    config_dir.mkdir()
+    config_path = config_dir / "config"
+    config_path.write_text("# SORT_ATTRIBUTE=due\n  SORT_ATTRIBUTE = context\n")
+
+    save_config_value("SORT_ATTRIBUTE", "created", home_dir=str(tmp_path))
+
+    expected = "# SORT_ATTRIBUTE=due\nSORT_ATTRIBUTE=created\n"
+    assert config_path.read_text() == expected
+    assert list(config_dir.iterdir()) == [config_path]
+
+
+def test_save_config_value_follows_symlink(tmp_path):
+    """A symlinked config stays a link; its target is updated, mode intact."""
+    dotfiles = tmp_path / "dotfiles"
+    dotfiles.mkdir()
+    real_config = dotfiles / "todo-config"
+    real_config.write_text("TODO_FILE=/home/user/todo.txt\n")
+    real_config.chmod(0o600)
+    config_dir = tmp_path / ".todo"
+    config_dir.mkdir()
+    config_path = config_dir / "config"
+    config_path.symlink_to(real_config)
+
+    save_config_value("SORT_ATTRIBUTE", "due", home_dir=str(tmp_path))
+
+    assert config_path.is_symlink()
+    assert real_config.read_text() == (
+        "TODO_FILE=/home/user/todo.txt\nSORT_ATTRIBUTE=due\n"
+    )
+    assert real_config.stat().st_mode & 0o777 == 0o600
+    assert sorted(dotfiles.iterdir()) == [real_config]
+
+
+def test_discover_files_defaults_resolve_symlinks(tmp_path, monkeypatch):
+    """Default paths live in the home directory and follow a symlinked file."""
+    monkeypatch.setattr(config_module, "_real_home", lambda: str(tmp_path))
+    real_todo = tmp_path / "sync" / "todo.txt"
+    real_todo.parent.mkdir()
+    real_todo.touch()
+    (tmp_path / "todo.txt").symlink_to(real_todo)
+
+    todo_file, done_file = discover_files()
+
+    assert todo_file == str(real_todo)
+    assert done_file == str(tmp_path / "done.txt")
+
+
+def test_discover_files_precedence(tmp_path):
+    """CLI arguments win over config values, and both are canonicalized."""
+    config = {"TODO_FILE": str(tmp_path / "a" / ".." / "config-todo.txt")}
+
+    todo_file, done_file = discover_files(
+        cli_done_file=str(tmp_path / "cli-done.txt"), config=config
+    )
+
+    assert todo_file == str(tmp_path / "config-todo.txt")
+    assert done_file == str(tmp_path / "cli-done.txt")
+
+
+def test_load_config_trims_and_skips_lines():
+    """load_config trims keys, keeps value text, and skips comments/blank lines."""
+    content = (
+        "# comment=ignored\n"
+        "   # indented=comment\n"
+        "\n"
+        "no separator\n"
+        "  TODO_FILE  =/home/user/todo.txt  \r\n"
+        "\tDONE_FILE= /home/user/done.txt\n"
+        "URL=http://example.com/?a=b\n"
+    )
+
+    assert load_config(content) == {
+        "TODO_FILE": "/home/user/todo.txt",
+        "DONE_FILE": " /home/user/done.txt",
+        "URL": "http://example.com/?a=b",
+    }
+
+
+def test_load_config_splits_on_every_line_boundary():
+    """Lines separated by a bare \\r, form feed or line separator stay apart."""
+    content = "A=1\rB=2\x0cC=3\u2028D=4"
+
+    assert load_config(content) == {"A": "1", "B": "2", "C": "3", "D": "4"}
@@ -1,209 +1,184 @@
 """Tests for the filter modal screen."""
 
 import pytest
-from textual.app import App, ComposeResult
 from textual.widgets import Button, SelectionList
 
-from checkmate.screens.filter import FilterScreen
+from checkmate.screens.filter import FilterResult, FilterScreen
 
+pytestmark = pytest.mark.slow
 
-@pytest.mark.asyncio
-async def test_filter_screen_compose():
-    """Test that FilterScreen composes with context and project selection lists."""
-
-    class TestApp(App):
-        def compose(self) -> ComposeResult:
-            yield FilterScreen(
-                contexts=["home", "work"],
-                projects=["backend", "frontend"],
-            )
 
-    app = TestApp()
-    async with app.run_test() as _:
-        app.query_one(FilterScreen)
+async def test_filter_screen_compose(filter_app):
+    """Test that FilterScreen composes with context and project selection lists."""
+    app, _ = filter_app
+    await app.push_screen(
+        FilterScreen(
+            contexts=["home", "work"],
+            projects=["backend", "frontend"],
+        )
+    )
+    screen = app.screen
+    assert isinstance(screen, FilterScreen)
 
-        contexts_list = app.query_one("#contexts-list", SelectionList)
-        projects_list = app.query_one("#projects-list", SelectionList)
+    contexts_list = screen.query_one("#contexts-list", SelectionList)
+    projects_list = screen.query_one("#projects-list", SelectionList)
 
-        assert contexts_list is not None
-        assert projects_list is not None
+    assert contexts_list is not None
+    assert projects_list is not None
 
 
-@pytest.mark.asyncio
-async def test_filter_screen_empty_lists():
+async def test_filter_screen_empty_lists(filter_app):
     """Test FilterScreen handles empty contexts and projects."""
-
-    class TestApp(App):
-        def compose(self) -> ComposeResult:
-            yield FilterScreen(contexts=[], projects=[])
-
-    app = TestApp()
-    async with app.run_test() as _:
-        app.query_one(FilterScreen)
-
-        contexts_list = app.query_one("#contexts-list", SelectionList)
-        projects_list = app.query_one("#projects-list", SelectionList)
-
-        assert len(contexts_list.selected) == 0
-        assert len(projects_list.selected) == 0
-
-
-@pytest.mark.asyncio
-async def test_filter_screen_preselects_current_filters():
+    app, _ = filter_app
+    await app.push_screen(FilterScreen(contexts=[], projects=[]))
+    screen = app.screen
+
+    contexts_list = screen.query_one("#contexts-list", SelectionList)
+    projects_list = screen.query_one("#projects-list", SelectionList)
+
+    assert len(contexts_list.selected) == 0
+    assert len(projects_list.selected) == 0
+
+
+async def test_filter_screen_sorts_and_dedupes_tags(filter_app):
+    """Test FilterScreen lists each tag once, in sorted order."""
+    app, _ = filter_app
+    await app.push_screen(
+        FilterScreen(
+            contexts=["work", "home", "work"],
+            projects=["frontend", "backend", "backend"],
+        )
+    )
+    screen = app.screen
+
+    contexts_list = screen.query_one("#contexts-list", SelectionList)
+    projects_list = screen.query_one("#projects-list", SelectionList)
+
+    assert [
+        contexts_list.get_option_at_index(i).value
+        for i in range(contexts_list.option_count)
+    ] == ["home", "work"]
+    assert [
+        projects_list.get_option_at_index(i).value
+        for i in range(projects_list.option_count)
+    ] == ["backend", "frontend"]
+
+
+async def test_filter_screen_preselects_current_filters(filter_app):
     """Test that current filter state is pre-selected."""
+    app, _ = filter_app
+    await app.push_screen(
+        FilterScreen(
+            contexts=["home", "work", "phone"],
+            projects=["backend", "frontend"],
+            selected_contexts=["home", "work"],
+            selected_projects=["frontend"],
+        )
+    )
+    screen = app.screen
 
-    class TestApp(App):
-        def compose(self) -> ComposeResult:
-            yield FilterScreen(
-                contexts=["home", "work", "phone"],
-                projects=["backend", "frontend"],
-                selected_contexts=["home", "work"],
-                selected_projects=["frontend"],
-            )
+    contexts_list = screen.query_one("#contexts-list", SelectionList)
+    projects_list = screen.query_one("#projects-list", SelectionList)
 
-    app = TestApp()
-    async with app.run_test() as _:
-        contexts_list = app.query_one("#contexts-list", SelectionList)
-        projects_list = app.query_one("#projects-list", SelectionList)
+    assert set(contexts_list.selected) == {"home", "work"}
+    assert set(projects_list.selected) == {"frontend"}
 
-        assert set(contexts_list.selected) == {"home", "work"}
-        assert set(projects_list.selected) == {"frontend"}
 
-
-@pytest.mark.asyncio
-async def test_filter_screen_apply_returns_result():
+async def test_filter_screen_apply_returns_result(filter_app, wait_until):
     """Test Apply button calls dismiss with FilterResult containing selections."""
-    from checkmate.screens.filter import FilterResult
-
-    class TestApp(App):
-        def __init__(self):
-            super().__init__()
-            self.dismiss_result = None
-
-        async def on_mount(self):
-            def capture_result(result):
-                self.dismiss_result = result
-
-            await self.push_screen(
-                FilterScreen(
-                    contexts=["home", "work"],
-                    projects=["backend", "frontend"],
-                    selected_contexts=["home"],
-                    selected_projects=["backend"],
-                ),
-                callback=capture_result,
-            )
-
-    app = TestApp()
-    async with app.run_test() as pilot:
-        await pilot.pause()  # Wait for screen to mount
-        screen = app.screen
-        apply_btn = screen.query_one("#apply-btn", Button)
-        apply_btn.press()
-        await pilot.pause()
-
-        assert app.dismiss_result is not None
-        assert isinstance(app.dismiss_result, FilterResult)
-        assert set(app.dismiss_result.contexts) == {"home"}
-        assert set(app.dismiss_result.projects) == {"backend"}
-
-
-@pytest.mark.asyncio
-async def test_filter_screen_cancel_returns_none():
+    app, pilot = filter_app
+    results = []
+    await app.push_screen(
+        FilterScreen(
+            contexts=["home", "work"],
+            projects=["backend", "frontend"],
+            selected_contexts=["home"],
+            selected_projects=["backend"],
+        ),
+        callback=results.append,
+    )
+    app.screen.query_one("#apply-btn", Button).press()
+    await wait_until(lambda: results, pilot)
+
+    assert len(results) == 1
+    result = results[0]
+    assert isinstance(result, FilterResult)
+    assert set(result.contexts) == {"home"}
+    assert set(result.projects) == {"backend"}
+
+
+async def test_filter_screen_cancel_returns_none(filter_app, wait_until):
     """Test Cancel button dismisses with None result."""
-
-    class TestApp(App):
-        def __init__(self):
-            super().__init__()
-            self.dismiss_called = False
-            self.dismiss_result = "not_none"
-
-        async def on_mount(self):
-            def capture_result(result):
-                self.dismiss_called = True
-                self.dismiss_result = result
-
-            await self.push_screen(
-                FilterScreen(
-                    contexts=["home", "work"],
-                    projects=["backend"],
-                ),
-                callback=capture_result,
-            )
-
-    app = TestApp()
-    async with app.run_test() as pilot:
-        await pilot.pause()  # Wait for screen to mount
-        screen = app.screen
-        cancel_btn = screen.query_one("#cancel-btn", Button)
-        cancel_btn.press()
-        await pilot.pause()
-
-        assert app.dismiss_called
-        assert app.dismiss_result is None
-
-
-@pytest.mark.asyncio
-async def test_filter_screen_escape_closes():
+    app, pilot = filter_app
+    results = []
+    await app.push_screen(
+        FilterScreen(
+            contexts=["home", "work"],
+            projects=["backend"],
+        ),
+        callback=results.append,
+    )
+    app.screen.query_one("#cancel-btn", Button).press()
+    await wait_until(lambda: results, pilot)
+
+    assert results == [None]
+
+
+async def test_filter_screen_escape_closes(filter_app, wait_until):
     """Test that Escape key closes screen without applying."""
-
-    class TestApp(App):
-        def compose(self) -> ComposeResult:
-            yield FilterScreen(
-                contexts=["home"],
-                projects=["backend"],
-            )
-
-    app = TestApp()
-    async with app.run_test() as pilot:
-        screen = app.query_one(FilterScreen)
-        assert screen is not None
-
-        await pilot.press("escape")
-        await pilot.pause()
-
-
-@pytest.mark.asyncio
-async def test_filter_screen_clear_button():
+    app, pilot = filter_app
+    results = []
+    await app.push_screen(
+        FilterScreen(
+            contexts=["home"],
+            projects=["backend"],
+        ),
+        callback=results.append,
+    )
+    assert isinstance(app.screen, FilterScreen)
+    initial_depth = len(app.screen_stack)
+
+    await pilot.press("escape")
+    await wait_until(lambda: len(app.screen_stack) < initial_depth, pilot)
+
+    assert not isinstance(app.screen, FilterScreen)
+    assert results == [None]
+
+
+async def test_filter_screen_clear_button(filter_app):
     """Test Clear button deselects all items."""
+    app, pilot = filter_app
+    await app.push_screen(
+        FilterScreen(
+            contexts=["home", "work"],
+            projects=["backend", "frontend"],
+            selected_contexts=["home", "work"],
+            selected_projects=["backend", "frontend"],
+        )
+    )
+    screen = app.screen
 
-    class TestApp(App):
-        def compose(self) -> ComposeResult:
-            yield FilterScreen(
-                contexts=["home", "work"],
-                projects=["backend", "frontend"],
-                selected_contexts=["home", "work"],
-                selected_projects=["backend", "frontend"],
-            )
+    contexts_list = screen.query_one("#contexts-list", SelectionList)
+    projects_list = screen.query_one("#projects-list", SelectionList)
 
-    app = TestApp()
-    async with app.run_test() as pilot:
-        contexts_list = app.query_one("#contexts-list", SelectionList)
-        projects_list = app.query_one("#projects-list", SelectionList)
+    assert len(contexts_list.selected) == 2
+    assert len(projects_list.selected) == 2
 
-        assert len(contexts_list.selected) == 2
-        assert len(projects_list.selected) == 2
+    screen.query_one("#clear-btn", Button).press()
+    await pilot.pause()
 
-        clear_btn = app.query_one("#clear-btn", Button)
-        clear_btn.press()
-        await pilot.pause()
+    assert len(contexts_list.selected) == 0
+    assert len(projects_list.selected) == 0
 
-        assert len(contexts_list.selected) == 0
-        assert len(projects_list.selected) == 0
 
-
-@pytest.mark.asyncio
-async def test_filter_screen_has_labels():
+async def test_filter_screen_has_labels(filter_app):
     """Test that FilterScreen has labels for both lists."""
-
-    class TestApp(App):
-        def compose(self) -> ComposeResult:
-            yield FilterScreen(
-                contexts=["home"],
-                projects=["backend"],
-            )
-
-    app = TestApp()
-    async with app.run_test() as _:
-        contexts_label = app.query_one("Label.list-label")
-        assert contexts_label is not None
+    app, _ = filter_app
+    await app.push_screen(
+        FilterScreen(
+            contexts=["home"],
+            projects=["backend"],
+        )
+    )
+    labels = app.screen.query("Label.list-label")
+    assert [str(label.content) for label in labels] == ["Contexts", "Projects"]
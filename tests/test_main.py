@@ -0,0 +1,37 @@
+"""Tests for command-line argument parsing."""
+
+import pytest
+
+from checkmate.main import parse_args
+
+
+def test_parse_args_defaults():
+    """No arguments leaves both paths unset."""
+    assert parse_args([]) == (None, None)
+
+
+def test_parse_args_separate_and_inline_values():
+    """Both `--opt value` and `--opt=value` forms are accepted."""
+    assert parse_args(["--todo", "a.txt", "--done=b.txt"]) == ("a.txt", "b.txt")
+
+
+def test_parse_args_last_value_wins():
+    """Repeating an option keeps the last value, like argparse."""
+    assert parse_args(["--todo=a.txt", "--todo=c.txt"]) == ("c.txt", None)
+
+
+@pytest.mark.parametrize("argv", [["--todo"], ["--bogus"], ["--done", "--todo=a"]])
+def test_parse_args_rejects_bad_usage(argv, capsys):
+    """Bad arguments exit with status 2 and print usage to stderr."""
+    with pytest.raises(SystemExit) as excinfo:
+        parse_args(argv)
+    assert excinfo.value.code == 2
+    assert "usage: checkmate" in capsys.readouterr().err
+
+
+def test_parse_args_help(capsys):
+    """--help prints usage to stdout and exits cleanly."""
+    with pytest.raises(SystemExit) as excinfo:
+        parse_args(["--help"])
+    assert excinfo.value.code == 0
+    assert "--todo TODO" in capsys.readouterr().out
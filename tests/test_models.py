@@ -0,0 +1,119 @@
+"""Tests for the Task domain model."""
+
+from datetime import date, timedelta
+
+from checkmate.models import Task, parse_iso_date
+
+
+def test_task_parses_projects_and_contexts():
+    """Projects and contexts are extracted from the description in order."""
+    task = Task("Plan trip +travel @home +budget @phone")
+    assert task.projects == ["travel", "budget"]
+    assert task.contexts == ["home", "phone"]
+
+
+def test_task_tags_may_overlap():
+    """A tag containing another sigil yields both a project and a context."""
+    task = Task("Email +team@work")
+    assert task.projects == ["team@work"]
+    assert task.contexts == ["work"]
+
+
+def test_repeated_sigils_do_not_add_tags():
+    """Each sigil run starts one tag; sigils inside a tag start no new one."""
+    task = Task("Merge +a+b and ++x @@home")
+    assert task.projects == ["a+b", "+x"]
+    assert task.contexts == ["@home"]
+
+
+def test_refresh_metadata_after_description_change():
+    """refresh_metadata re-parses tags from the current description."""
+    task = Task("Old +alpha")
+    task.description = "New @beta"
+    task.refresh_metadata()
+    assert task.projects == []
+    assert task.contexts == ["beta"]
+
+    task.description = "Untagged"
+    task.refresh_metadata()
+    assert task.projects == []
+    assert task.contexts == []
+
+
+def test_due_status_relative_to_today():
+    """is_overdue and is_due_today compare against the current date."""
+    today = date.today()
+
+    overdue = Task("Late")
+    overdue.due_date = today - timedelta(days=1)
+    assert overdue.is_overdue
+    assert not overdue.is_due_today
+
+    due_today = Task("Now")
+    due_today.due_date = today
+    assert due_today.is_due_today
+    assert not due_today.is_overdue
+
+
+def test_completed_task_is_never_overdue():
+    """Completed tasks report neither overdue nor due today."""
+    task = Task("Done")
+    task.due_date = date.today() - timedelta(days=3)
+    task.complete()
+    assert not task.is_overdue
+    assert not task.is_due_today
+
+
+def test_due_date_follows_attribute_changes():
+    """due_date reflects direct edits to the raw attribute."""
+    task = Task("Pay rent", attributes={"due": "2025-01-31"})
+    assert task.due_date == date(2025, 1, 31)
+
+    task.attributes["due"] = ["2025-02-28"]
+    assert task.due_date == date(2025, 2, 28)
+
+    task.attributes["due"] = "not-a-date"
+    assert task.due_date is None
+
+    del task.attributes["due"]
+    assert task.due_date is None
+
+
+def test_display_strings():
+    """Display strings are ISO dates, empty when the date is missing."""
+    task = Task(
+        "Pay rent",
+        creation_date=date(2025, 1, 2),
+        attributes={"due": "2025-01-31"},
+    )
+    assert task.display_created == "2025-01-02"
+    assert task.display_due == "2025-01-31"
+    assert task.display_completed == ""
+
+    task.attributes["due"] = "not-a-date"
+    assert task.display_due == ""
+
+    task.due_date = date(2025, 3, 4)
+    assert task.display_due == "2025-03-04"
+
+    task.complete()
+    assert task.display_completed == date.today().isoformat()
+
+
+def test_parse_iso_date():
+    """parse_iso_date accepts only well-formed YYYY-MM-DD dates."""
+    assert parse_iso_date("2024-02-29") == date(2024, 2, 29)
+    assert parse_iso_date("2023-02-29") is None
+    assert parse_iso_date("2024-2-29") is None
+    assert parse_iso_date("2024/02/29") is None
+    assert parse_iso_date("2024-+2-29") is None
+    assert parse_iso_date("٢٠٢٤-02-29") is None
+    assert parse_iso_date("") is None
+
+
+def test_task_instances_are_slotted():
+    """Task and its repository subclass carry no per-instance __dict__."""
+    from checkmate.repository import _TaskWithMeta
+
+    assert not hasattr(Task("Plain"), "__dict__")
+    assert not hasattr(_TaskWithMeta("Loaded"), "__dict__")
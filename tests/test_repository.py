@@ -1,20 +1,50 @@
+import os
+import sys
+
 import pytest
 
 from checkmate.models import Task
 from checkmate.repository import FileTaskRepository, TaskRepositoryError
 
 
+@pytest.fixture(scope="module")
+def repo_dir(tmp_path_factory):
+    return tmp_path_factory.mktemp("repo")
+
+
 @pytest.fixture
-def repo(tmp_path):
-    todo_file = tmp_path / "todo.txt"
-    done_file = tmp_path / "done.txt"
+def repo(repo_dir):
+    # One directory per module; each test gets emptied files and a new repo
+    todo_file = repo_dir / "todo.txt"
+    done_file = repo_dir / "done.txt"
+    todo_file.write_text("")
+    done_file.write_text("")
     return FileTaskRepository(str(todo_file), str(done_file))
 
 
-def test_repository_raises_error_on_io_failure(repo, tmp_path):
-    # Make file read-only to trigger IO error
+# Permission bits deny nothing to root, and chmod(0) is a no-op on Windows
+requires_chmod = pytest.mark.skipif(
+    sys.platform == "win32" or os.geteuid() == 0,
+    reason="file permissions are not enforced here",
+)
+
+
+@pytest.fixture(scope="module")
+def readonly_dir(tmp_path_factory):
+    # Create a directory that is read-only
+    d = tmp_path_factory.mktemp("readonly")
+    d.chmod(0o444)
+    yield d
+    # Restore permission to allow cleanup
+    d.chmod(0o777)
+
+
+@requires_chmod
+def test_repository_raises_error_on_io_failure(tmp_path):
+    # Its own files, so the shared repo directory is never made unreadable
     p = tmp_path / "todo.txt"
-    p.touch()
+    repo = FileTaskRepository(str(p), str(tmp_path / "done.txt"))
+    # Make file read-only to trigger IO error
     p.chmod(0o000)
 
     try:
@@ -24,29 +54,25 @@ def test_repository_raises_error_on_io_failure(repo, tmp_path):
         p.chmod(0o666)  # restore
 
 
-def test_repository_validates_distinct_paths(tmp_path):
-    f = tmp_path / "tasks.txt"
+def test_repository_validates_distinct_paths():
+    # Rejected before any file is touched, so the paths need not exist
     with pytest.raises(ValueError, match="distinct"):
-        FileTaskRepository(str(f), str(f))
-
+        FileTaskRepository("/nonexistent/tasks.txt", "/nonexistent/tasks.txt")
+    with pytest.raises(ValueError, match="distinct"):
+        FileTaskRepository("tasks.txt", "./tasks.txt")
 
-def test_repository_validates_accessibility(tmp_path):
-    # Create a directory that is read-only
-    d = tmp_path / "readonly"
-    d.mkdir()
-    try:
-        # Remove write permission
-        d.chmod(0o444)
 
-        # Attempt to create files inside readonly dir
-        with pytest.raises(ValueError, match="accessible"):
-            FileTaskRepository(str(d / "todo.txt"), str(d / "done.txt"))
-    finally:
-        # Restore permission to allow cleanup
-        d.chmod(0o777)
+@requires_chmod
+def test_repository_validates_accessibility(readonly_dir):
+    # Attempt to create files inside readonly dir
+    with pytest.raises(ValueError, match="accessible"):
+        FileTaskRepository(
+            str(readonly_dir / "todo.txt"), str(readonly_dir / "done.txt")
+        )
 
 
-def test_save_generates_id(repo, tmp_path):
+def test_save_generates_id(repo):
+    todo = repo.todo_file
     task = Task("Test task")
     repo.save(task)
 
@@ -54,7 +80,7 @@ def test_save_generates_id(repo, tmp_path):
     assert "cmid" in task.attributes
 
     # Verify ID is persisted to file
-    content = (tmp_path / "todo.txt").read_text()
+    content = todo.read_text()
     assert f"cmid:{task.attributes['cmid']}" in content
 
 
@@ -67,3 +93,240 @@ def test_id_is_stable(repo):
     repo.save(task)
 
     assert task.attributes["cmid"] == initial_id
+
+
+def test_save_new_task_appends_line(repo):
+    todo = repo.todo_file
+    todo.write_text("(A) Existing task")
+
+    repo.save(Task("New task"))
+
+    lines = todo.read_text().splitlines()
+    assert lines[0] == "(A) Existing task"
+    assert lines[1].startswith("New task cmid:")
+    assert todo.read_text().endswith("\n")
+    assert [t.description for t in repo.get_active_tasks()] == [
+        "Existing task",
+        "New task",
+    ]
+
+
+def test_update_and_move_keep_single_copy(repo):
+    todo = repo.todo_file
+    task = Task("Write report")
+    repo.save(task)
+
+    task.description = "Write final report"
+    repo.save(task)
+    assert todo.read_text().count("cmid:") == 1
+
+    task.complete()
+    repo.save(task)
+    assert repo.get_active_tasks() == []
+    assert [t.description for t in repo.get_completed_tasks()] == ["Write final report"]
+
+
+def test_delete_legacy_task_without_id(repo):
+    todo = repo.todo_file
+    todo.write_text("(A) Legacy task\nOther task\n")
+
+    legacy = repo.get_active_tasks()[0]
+    assert legacy.id is None
+    repo.delete(legacy)
+
+    assert todo.read_text() == "Other task\n"
+
+
+def test_update_leaves_other_lines_untouched(repo):
+    todo = repo.todo_file
+    todo.write_text("x 2024-01-05 2024-01-01 Unusual   spacing\n\nKeep me\n")
+    task = Task("Edit me")
+    repo.save(task)
+
+    task.description = "Edited"
+    repo.save(task)
+
+    lines = todo.read_text().splitlines()
+    assert lines[:3] == ["x 2024-01-05 2024-01-01 Unusual   spacing", "", "Keep me"]
+    assert lines[3] == f"Edited cmid:{task.id}"
+
+
+def test_writes_preserve_crlf_line_endings(repo):
+    todo = repo.todo_file
+    todo.write_bytes(b"First\r\nSecond")
+    task = Task("Third")
+    repo.save(task)
+    task.priority = "B"
+    repo.save(task)
+
+    assert todo.read_bytes() == (
+        f"First\r\nSecond\r\n(B) Third cmid:{task.id}\r\n".encode()
+    )
+    assert [t.description for t in repo.get_active_tasks()] == [
+        "First",
+        "Second",
+        "Third",
+    ]
+
+
+def test_cached_reads_are_independent_and_see_external_edits(repo):
+    todo = repo.todo_file
+    todo.write_text("Task one @home\n")
+
+    first = repo.get_active_tasks()
+    first[0].attributes["due"] = "2030-01-01"
+    first[0].contexts.append("work")
+
+    second = repo.get_active_tasks()
+    assert second[0].attributes == {}
+    assert second[0].contexts == ["home"]
+
+    todo.write_text("Task one @home\nTask two\n")
+    assert len(repo.get_active_tasks()) == 2
+
+
+def test_completing_loaded_task_leaves_done_lines_unread(repo):
+    todo = repo.todo_file
+    done = repo.done_file
+    todo.write_text("Ship it cmid:abc12345\n")
+    done.write_text("x Old work cmid:abc12345\n")
+
+    task = repo.get_active_tasks()[0]
+    task.is_completed = True
+    repo.save(task)
+
+    assert todo.read_text() == ""
+    assert done.read_text().splitlines() == [
+        "x Old work cmid:abc12345",
+        "x Ship it cmid:abc12345",
+    ]
+
+
+def test_own_writes_refresh_cache_without_reparse(repo, monkeypatch):
+    todo = repo.todo_file
+    todo.write_text("First\n\nSecond cmid:aaaa1111\n")
+    repo.get_active_tasks()
+
+    parsed = []
+    parse_line = FileTaskRepository._parse_line
+
+    def counting_parse(line, source_file=None):
+        parsed.append(line)
+        return parse_line(line, source_file)
+
+    monkeypatch.setattr(FileTaskRepository, "_parse_line", staticmethod(counting_parse))
+    task = repo.get_active_tasks()[1]
+    task.priority = "A"
+    repo.save(task)
+    repo.save(Task("Third"))
+
+    tasks = repo.get_active_tasks()
+    assert [t.description for t in tasks] == ["First", "Second", "Third"]
+    assert tasks[1].priority == "A"
+    assert len(parsed) == 2
+
+
+def test_delete_by_id_uses_cached_index(repo):
+    todo = repo.todo_file
+    done = repo.done_file
+    todo.write_text("Keep cmid:aaaa1111\n")
+    done.write_text("x Drop cmid:bbbb2222\nx Other cmid:cccc3333\n")
+    repo.get_active_tasks()
+    repo.get_completed_tasks()
+
+    repo.delete(Task("Drop", attributes={"cmid": "bbbb2222"}))
+
+    assert todo.read_text() == "Keep cmid:aaaa1111\n"
+    assert done.read_text() == "x Other cmid:cccc3333\n"
+    assert [t.id for t in repo.get_completed_tasks()] == ["cccc3333"]
+
+
+def test_delete_rechecks_lines_the_cache_points_at(repo):
+    todo = repo.todo_file
+    todo.write_text("Alpha cmid:aaaa1111\nBravo cmid:bbbb2222\n")
+    alpha, _ = repo.get_active_tasks()
+
+    # Same size and mtime, so the cache still looks current
+    st = todo.stat()
+    todo.write_text("Bravo cmid:bbbb2222\nAlpha cmid:aaaa1111\n")
+    os.utime(todo, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    repo.delete(alpha)
+
+    assert todo.read_text() == "Bravo cmid:bbbb2222\n"
+
+
+def test_load_strips_only_whole_attribute_tokens(repo):
+    todo = repo.todo_file
+    todo.write_text("Call mom k:v  k:v:w see http://x.y due:2030-01-01$ok\n")
+
+    task = repo.get_active_tasks()[0]
+
+    assert task.description == "Call mom see http://x.y $ok"
+    assert task.attributes["k"] == ["v", "v:w"]
+
+
+def test_saving_unchanged_task_skips_write(repo):
+    todo = repo.todo_file
+    todo.write_text("Same cmid:aaaa1111\n")
+    task = repo.get_active_tasks()[0]
+    before = todo.stat().st_mtime_ns
+
+    repo.save(task)
+    assert todo.stat().st_mtime_ns == before
+
+    todo.write_text("Edited elsewhere\n")
+    repo.save(task)
+    assert todo.read_text() == "Edited elsewhere\nSame cmid:aaaa1111\n"
+
+
+def test_saving_stale_copy_still_writes(repo):
+    todo = repo.todo_file
+    todo.write_text("Original cmid:aaaa1111\n")
+    first, second = repo.get_active_tasks()[0], repo.get_active_tasks()[0]
+
+    first.description = "Changed"
+    repo.save(first)
+    repo.save(second)
+
+    assert todo.read_text() == "Original cmid:aaaa1111\n"
+
+
+def test_init_creates_missing_files_and_keeps_existing(tmp_path):
+    todo = tmp_path / "todo.txt"
+    todo.write_text("Existing\n")
+    before = todo.stat().st_mtime_ns
+    done = tmp_path / "nested" / "dir" / "done.txt"
+
+    FileTaskRepository(str(todo), str(done))
+
+    assert done.read_text() == ""
+    assert todo.read_text() == "Existing\n"
+    assert todo.stat().st_mtime_ns == before
+
+
+def test_load_splits_on_any_line_ending(repo):
+    todo = repo.todo_file
+    todo.write_bytes(b"One\rTwo\r\n\r\nThree\nFour")
+
+    descriptions = [t.description for t in repo.get_active_tasks()]
+
+    assert descriptions == ["One", "Two", "Three", "Four"]
+
+
+def test_removing_lines_replaces_the_file_atomically(repo):
+    done = repo.done_file
+    history = "".join(f"x Old task {i} cmid:{i:08x}\n" for i in range(500))
+    done.write_text(history + "x Recent cmid:ffffffff\n")
+    inode = done.stat().st_ino
+
+    task = repo.get_completed_tasks()[-1]
+    task.is_completed = False
+    repo.save(task)
+
+    assert done.read_text() == history
+    # Written to a temp file and renamed over, never patched in place
+    assert done.stat().st_ino != inode
+
+    repo.delete(repo.get_completed_tasks()[0])
+    assert done.read_text() == history.split("\n", 1)[1]
@@ -3,16 +3,7 @@ from datetime import date
 import pytest
 
 from checkmate.exceptions import TaskValidationError
-from checkmate.repository import FileTaskRepository
-from checkmate.services import TodoService
-
-
-@pytest.fixture
-def service(tmp_path):
-    todo_file = tmp_path / "todo.txt"
-    done_file = tmp_path / "done.txt"
-    repo = FileTaskRepository(str(todo_file), str(done_file))
-    return TodoService(repo)
+from checkmate.models import Task
 
 
 def test_create_task(service):
@@ -77,6 +68,11 @@ def test_create_task_validation(service):
     ):
         service.create_task("Invalid priority", priority="1")
 
+    with pytest.raises(
+        TaskValidationError, match="Priority must be a single uppercase letter"
+    ):
+        service.create_task("Invalid priority", priority="É")
+
 
 def test_create_task_empty_description(service):
     with pytest.raises(TaskValidationError, match="Task description cannot be empty"):
@@ -94,19 +90,23 @@ def test_get_unique_contexts_empty(service):
     assert service.get_unique_contexts() == []
 
 
-def test_get_unique_contexts(service):
-    service.create_task("Task one @home @work")
-    service.create_task("Task two @work @phone")
-    service.create_task("Task three")
+def test_get_unique_contexts(service, memory_repository):
+    memory_repository.tasks.extend(
+        [
+            Task("Task one @home @work"),
+            Task("Task two @work @phone"),
+            Task("Task three"),
+        ]
+    )
 
     contexts = service.get_unique_contexts()
     assert contexts == ["home", "phone", "work"]
 
 
-def test_get_unique_contexts_excludes_completed(service):
-    task = service.create_task("Task @home @work")
-    service.create_task("Task @phone")
-    service.complete_task(task)
+def test_get_unique_contexts_excludes_completed(service, memory_repository):
+    memory_repository.tasks.extend(
+        [Task("Task @home @work", is_completed=True), Task("Task @phone")]
+    )
 
     contexts = service.get_unique_contexts()
     assert contexts == ["phone"]
@@ -116,19 +116,67 @@ def test_get_unique_projects_empty(service):
     assert service.get_unique_projects() == []
 
 
-def test_get_unique_projects(service):
-    service.create_task("Task one +backend +frontend")
-    service.create_task("Task two +frontend +mobile")
-    service.create_task("Task three")
+def test_get_unique_projects(service, memory_repository):
+    memory_repository.tasks.extend(
+        [
+            Task("Task one +backend +frontend"),
+            Task("Task two +frontend +mobile"),
+            Task("Task three"),
+        ]
+    )
 
     projects = service.get_unique_projects()
     assert projects == ["backend", "frontend", "mobile"]
 
 
-def test_get_unique_projects_excludes_completed(service):
-    task = service.create_task("Task +backend +frontend")
-    service.create_task("Task +mobile")
-    service.complete_task(task)
+def test_get_unique_projects_excludes_completed(service, memory_repository):
+    memory_repository.tasks.extend(
+        [Task("Task +backend +frontend", is_completed=True), Task("Task +mobile")]
+    )
 
     projects = service.get_unique_projects()
     assert projects == ["mobile"]
+
+
+def test_get_unique_contexts_and_projects_fetches_once(service, monkeypatch):
+    service.create_task("Task @home +backend")
+
+    calls = 0
+    fetch = service.repository.get_active_tasks
+
+    def counting_fetch():
+        nonlocal calls
+        calls += 1
+        return fetch()
+
+    monkeypatch.setattr(service.repository, "get_active_tasks", counting_fetch)
+
+    assert service.get_unique_contexts_and_projects() == (["home"], ["backend"])
+    assert calls == 1
+
+
+def test_get_unique_contexts_and_projects(service, memory_repository):
+    memory_repository.tasks.extend(
+        [
+            Task("Task one @work +backend"),
+            Task("Task two @home +frontend @work"),
+            Task("Task three @phone +mobile", is_completed=True),
+        ]
+    )
+
+    contexts, projects = service.get_unique_contexts_and_projects()
+    assert contexts == ["home", "work"]
+    assert projects == ["backend", "frontend"]
+
+
+def test_update_task_same_description_keeps_metadata(service, monkeypatch):
+    task = service.create_task("Call mom @phone")
+
+    def fail(self):
+        raise AssertionError("metadata re-parsed for an unchanged description")
+
+    monkeypatch.setattr(Task, "refresh_metadata", fail)
+    service.update_task(task, description="Call mom @phone", priority="A")
+
+    assert task.priority == "A"
+    assert task.contexts == ["phone"]
@@ -1,160 +1,66 @@
 """Tests for the sort selection modal screen."""
 
 import pytest
-from textual.app import App, ComposeResult
 from textual.widgets import Button
 
 from checkmate.screens.sort_select import SortSelectScreen
 
-
-@pytest.mark.asyncio
-async def test_sort_select_screen_compose():
-    """Test that SortSelectScreen composes with all button options."""
-
-    class TestApp(App):
-        def compose(self) -> ComposeResult:
-            yield SortSelectScreen(callback=lambda x: None)
-
-    app = TestApp()
-    async with app.run_test() as _:
-        app.query_one(SortSelectScreen)
-
-        # Query buttons by their IDs
-        buttons = app.query("Button")
-        button_ids = [b.id for b in buttons]
-
-        assert "sort-priority-btn" in button_ids
-        assert "sort-context-btn" in button_ids
-        assert "sort-project-btn" in button_ids
-        assert "sort-due-btn" in button_ids
-        assert "sort-created-btn" in button_ids
-
-
-@pytest.mark.asyncio
-async def test_sort_select_priority_button():
-    """Test clicking the Priority sort button."""
-    callback_results = []
-
-    def test_callback(attr):
-        callback_results.append(attr)
-
-    class TestApp(App):
-        def compose(self) -> ComposeResult:
-            yield SortSelectScreen(callback=test_callback)
-
-    app = TestApp()
-    async with app.run_test() as pilot:
-        button = app.query_one("#sort-priority-btn", Button)
-        button.press()
-        await pilot.pause()
-
-        assert "priority" in callback_results
-
-
-@pytest.mark.asyncio
-async def test_sort_select_context_button():
-    """Test clicking the Context sort button."""
-    callback_results = []
-
-    def test_callback(attr):
-        callback_results.append(attr)
-
-    class TestApp(App):
-        def compose(self) -> ComposeResult:
-            yield SortSelectScreen(callback=test_callback)
-
-    app = TestApp()
-    async with app.run_test() as pilot:
-        button = app.query_one("#sort-context-btn", Button)
-        button.press()
-        await pilot.pause()
-
-        assert "context" in callback_results
-
-
-@pytest.mark.asyncio
-async def test_sort_select_project_button():
-    """Test clicking the Project sort button."""
-    callback_results = []
-
-    def test_callback(attr):
-        callback_results.append(attr)
-
-    class TestApp(App):
-        def compose(self) -> ComposeResult:
-            yield SortSelectScreen(callback=test_callback)
-
-    app = TestApp()
-    async with app.run_test() as pilot:
-        button = app.query_one("#sort-project-btn", Button)
-        button.press()
-        await pilot.pause()
-
-        assert "project" in callback_results
+pytestmark = pytest.mark.slow
 
 
-@pytest.mark.asyncio
-async def test_sort_select_due_button():
-    """Test clicking the Due date sort button."""
+@pytest.fixture
+async def sort_app(screen_app):
+    """Push a SortSelectScreen recording its callback onto the shared app."""
+    app, pilot = screen_app
     callback_results = []
+    await app.push_screen(SortSelectScreen(callback=callback_results.append))
+    yield app, pilot, callback_results
+    await pilot.pause()
+    while len(app.screen_stack) > 1:
+        await app.pop_screen()
 
-    def test_callback(attr):
-        callback_results.append(attr)
 
-    class TestApp(App):
-        def compose(self) -> ComposeResult:
-            yield SortSelectScreen(callback=test_callback)
-
-    app = TestApp()
-    async with app.run_test() as pilot:
-        button = app.query_one("#sort-due-btn", Button)
-        button.press()
-        await pilot.pause()
-
-        assert "due" in callback_results
-
-
-@pytest.mark.asyncio
-async def test_sort_select_created_button():
-    """Test clicking the Created date sort button."""
-    callback_results = []
-
-    def test_callback(attr):
-        callback_results.append(attr)
-
-    class TestApp(App):
-        def compose(self) -> ComposeResult:
-            yield SortSelectScreen(callback=test_callback)
-
-    app = TestApp()
-    async with app.run_test() as pilot:
-        button = app.query_one("#sort-created-btn", Button)
-        button.press()
-        await pilot.pause()
-
-        assert "created" in callback_results
-
-
-@pytest.mark.asyncio
-async def test_sort_select_escape_closes():
+async def test_sort_select_screen_compose(sort_app):
+    """Test that SortSelectScreen composes with all button options."""
+    app, _, _ = sort_app
+    assert isinstance(app.screen, SortSelectScreen)
+
+    button_ids = [b.id for b in app.screen.query(Button)]
+
+    assert "sort-priority-btn" in button_ids
+    assert "sort-context-btn" in button_ids
+    assert "sort-project-btn" in button_ids
+    assert "sort-due-btn" in button_ids
+    assert "sort-created-btn" in button_ids
+
+
+async def test_sort_select_all_buttons(sort_app, wait_until):
+    """Test that each sort button reports its attribute and closes the screen."""
+    app, pilot, callback_results = sort_app
+    buttons = [
+        ("sort-priority-btn", "priority"),
+        ("sort-context-btn", "context"),
+        ("sort-project-btn", "project"),
+        ("sort-due-btn", "due"),
+        ("sort-created-btn", "created"),
+    ]
+    for pressed, (btn_id, _) in enumerate(buttons):
+        if pressed:
+            # A press dismisses the screen; bring up the next one
+            await app.push_screen(SortSelectScreen(callback=callback_results.append))
+        app.screen.query_one(f"#{btn_id}", Button).press()
+        await wait_until(lambda: not isinstance(app.screen, SortSelectScreen), pilot)
+
+    assert callback_results == [expected for _, expected in buttons]
+
+
+async def test_sort_select_escape_closes(sort_app):
     """Test that Escape key closes the screen without callback."""
-    callback_called = False
-
-    def test_callback(attr):
-        nonlocal callback_called
-        callback_called = True
-
-    class TestApp(App):
-        def compose(self) -> ComposeResult:
-            yield SortSelectScreen(callback=test_callback)
-
-    app = TestApp()
-    async with app.run_test() as pilot:
-        app.query_one(SortSelectScreen)
+    app, pilot, callback_results = sort_app
 
-        # Press escape
-        await pilot.press("escape")
-        await pilot.pause()
+    await pilot.press("escape")
+    await pilot.pause()
 
-        # Callback should not have been called
-        assert not callback_called
+    assert not isinstance(app.screen, SortSelectScreen)
+    # Callback should not have been called
+    assert not callback_results
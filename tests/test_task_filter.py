@@ -0,0 +1,92 @@
+"""Tests for TaskFilter, the widget-independent task filter."""
+
+from checkmate.filter import TaskFilter
+from checkmate.models import Task
+
+# Parsed once; matching only reads a task's tags, so tests can share them
+GROCERIES = Task(description="Buy groceries @home +shopping")
+CALL_MOM = Task(description="Call mom @phone")
+FIX_API = Task(description="Fix API endpoint +backend")
+ORDER_SUPPLIES = Task(description="Order supplies @home +shopping")
+MEETING = Task(description="Meeting @work @office +project")
+UPDATE_STYLES = Task(description="Update styles +frontend +design")
+UNTAGGED = Task(description="Simple task without tags")
+
+
+class TestTaskFilterMatches:
+    """Tests for filter matching logic."""
+
+    def test_task_matches_filter_no_filter(self):
+        """Task matches when no filter is applied."""
+        task_filter = TaskFilter()
+        assert task_filter.matches(GROCERIES)
+
+    def test_task_matches_context_filter(self):
+        """Task matches when it has a matching context."""
+        task_filter = TaskFilter(contexts=frozenset({"home"}))
+        assert task_filter.matches(GROCERIES)
+
+    def test_task_does_not_match_context_filter(self):
+        """Task does not match when context doesn't match."""
+        task_filter = TaskFilter(contexts=frozenset({"work"}))
+        assert not task_filter.matches(GROCERIES)
+
+    def test_task_matches_project_filter(self):
+        """Task matches when it has a matching project."""
+        task_filter = TaskFilter(projects=frozenset({"shopping"}))
+        assert task_filter.matches(GROCERIES)
+
+    def test_task_does_not_match_project_filter(self):
+        """Task does not match when project doesn't match."""
+        task_filter = TaskFilter(projects=frozenset({"backend"}))
+        assert not task_filter.matches(GROCERIES)
+
+    def test_task_matches_any_context_or_logic(self):
+        """Task matches if it has ANY of the selected contexts (OR logic)."""
+        task_filter = TaskFilter(contexts=frozenset({"home", "work", "phone"}))
+        assert task_filter.matches(CALL_MOM)
+
+    def test_task_matches_any_project_or_logic(self):
+        """Task matches if it has ANY of the selected projects (OR logic)."""
+        task_filter = TaskFilter(
+            frozenset([]), frozenset(["backend", "frontend", "devops"])
+        )
+        assert task_filter.matches(FIX_API)
+
+    def test_task_matches_context_or_project(self):
+        """Task matches if it has matching context OR project."""
+        task_filter = TaskFilter(
+            contexts=frozenset({"work"}), projects=frozenset({"shopping"})
+        )
+        # Task has @home (not work) but +shopping (matches)
+        assert task_filter.matches(ORDER_SUPPLIES)
+
+    def test_task_with_multiple_contexts_matches(self):
+        """Task with multiple contexts matches if any context matches."""
+        task_filter = TaskFilter(contexts=frozenset({"work"}))
+        assert task_filter.matches(MEETING)
+
+    def test_task_with_multiple_projects_matches(self):
+        """Task with multiple projects matches if any project matches."""
+        task_filter = TaskFilter(projects=frozenset({"frontend"}))
+        assert task_filter.matches(UPDATE_STYLES)
+
+    def test_task_no_tags_does_not_match_filter(self):
+        """Task without any tags doesn't match when filter is active."""
+        task_filter = TaskFilter(contexts=frozenset({"home"}))
+        assert not task_filter.matches(UNTAGGED)
+
+
+class TestTaskFilterSelect:
+    """Tests for selecting the tasks that pass a filter."""
+
+    def test_inactive_filter_returns_tasks_unchanged(self):
+        """An empty filter hands back the same list without copying it."""
+        tasks = [GROCERIES, UNTAGGED]
+        assert TaskFilter().select(tasks) is tasks
+
+    def test_select_keeps_matching_tasks_in_order(self):
+        """Only matching tasks are kept, in their original order."""
+        task_filter = TaskFilter(frozenset({"home"}), frozenset({"backend"}))
+        tasks = [GROCERIES, CALL_MOM, FIX_API, UNTAGGED, ORDER_SUPPLIES]
+        assert task_filter.select(tasks) == [GROCERIES, FIX_API, ORDER_SUPPLIES]
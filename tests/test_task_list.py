@@ -0,0 +1,209 @@
+"""Tests for the task list widgets."""
+
+import pytest
+
+from checkmate.models import Task
+from checkmate.widgets.task_list import (
+    _SORT_KEYS,
+    CompletedTaskList,
+    TaskList,
+    TaskRow,
+    _description_segments,
+)
+
+
+@pytest.mark.slow
+async def test_schedule_refresh_coalesces_requests(service, run_list_app):
+    """A burst of scheduled refreshes reloads the list once."""
+    async with run_list_app(CompletedTaskList) as pilot:
+        completed_list = pilot.app.query_one(CompletedTaskList)
+        task = service.create_task("Ship it")
+        service.complete_task(task)
+
+        reloads = 0
+        refresh_tasks = completed_list.refresh_tasks
+
+        def counting_refresh():
+            nonlocal reloads
+            reloads += 1
+            refresh_tasks()
+
+        completed_list.refresh_tasks = counting_refresh
+        for _ in range(3):
+            completed_list.schedule_refresh()
+        await pilot.pause(0.3)
+
+        assert reloads == 1
+        assert [t.description for t in completed_list.tasks] == ["Ship it"]
+
+
+@pytest.mark.slow
+async def test_move_focus_by_stops_at_either_end(service, run_list_app):
+    """move_focus_by clamps a multi-row move to the list bounds."""
+    for description in ("One", "Two", "Three"):
+        service.complete_task(service.create_task(description))
+
+    async with run_list_app(CompletedTaskList) as pilot:
+        completed_list = pilot.app.query_one(CompletedTaskList)
+
+        completed_list.move_focus_by(2)
+        assert completed_list.focused_task_index == 2
+        completed_list.move_focus_by(5)
+        assert completed_list.focused_task_index == 2
+        completed_list.move_focus_by(-1)
+        assert completed_list.focused_task_index == 1
+        completed_list.move_focus_by(-5)
+        assert completed_list.focused_task_index == 0
+
+
+@pytest.mark.slow
+async def test_key_after_cursor_move_acts_on_the_new_row(service, wait_until):
+    """An action key sent right behind j acts on the row j moved to."""
+    from textual.events import Key
+
+    from checkmate.app import CheckmateApp
+
+    service.create_task("task one")
+    service.create_task("task two")
+
+    async with CheckmateApp(service).run_test() as pilot:
+        task_list = pilot.app.screen.query_one(TaskList)
+        task_list.focus()
+        await pilot.pause()
+
+        for key in ("j", "x"):
+            pilot.app.post_message(Key(key, key))
+        await wait_until(service.get_completed_tasks, pilot)
+
+        assert [t.description for t in service.get_completed_tasks()] == ["task two"]
+
+
+@pytest.mark.slow
+async def test_focus_styling_follows_cursor_across_reload(service, run_list_app):
+    """Exactly the row at the cursor is styled, including after a reload."""
+    for description in ("One", "Two", "Three"):
+        service.complete_task(service.create_task(description))
+
+    def styled_rows(task_list: CompletedTaskList) -> list[str]:
+        return [
+            row.task.description
+            for row in task_list.query_children(TaskRow)
+            if row.has_class("focused")
+        ]
+
+    async with run_list_app(CompletedTaskList) as pilot:
+        completed_list = pilot.app.query_one(CompletedTaskList)
+        await pilot.pause()
+        assert styled_rows(completed_list) == ["One"]
+
+        completed_list.move_focus_by(1)
+        completed_list.move_focus_by(1)
+        await pilot.pause()
+        assert styled_rows(completed_list) == ["Three"]
+
+        completed_list.refresh_tasks()
+        await pilot.pause()
+        assert styled_rows(completed_list) == ["Three"]
+
+
+@pytest.mark.slow
+async def test_filter_keeps_rows_when_shown_tasks_are_unchanged(service, run_list_app):
+    """A filter that matches every shown task reuses the mounted rows."""
+    service.create_task("Dishes @home")
+    service.create_task("Laundry @home")
+
+    async with run_list_app(TaskList) as pilot:
+        task_list = pilot.app.query_one(TaskList)
+        rows = list(task_list.query_children(TaskRow))
+        assert len(rows) == 2
+
+        task_list.apply_filter(contexts=["home"], projects=[])
+        await pilot.pause()
+        assert list(task_list.query_children(TaskRow)) == rows
+
+        task_list.apply_filter(contexts=["work"], projects=[])
+        await pilot.pause()
+        assert list(task_list.query_children(TaskRow)) == []
+
+
+@pytest.mark.slow
+async def test_cursor_indexes_filtered_rows(service, run_list_app):
+    """With a filter active, the cursor selects among the shown tasks only."""
+    service.create_task("Report @work")
+    service.create_task("Dishes @home")
+    service.create_task("Laundry @home")
+
+    async with run_list_app(TaskList) as pilot:
+        task_list = pilot.app.query_one(TaskList)
+        task_list.apply_filter(contexts=["home"], projects=[])
+
+        task = task_list.get_task_at_cursor()
+        assert task is not None and task.description == "Dishes @home"
+        task_list.move_focus_by(5)
+        assert task_list.focused_task_index == 1
+
+
+@pytest.mark.slow
+async def test_reload_reuses_rows(service, run_list_app):
+    """A reload rebinds the mounted rows to the reloaded tasks."""
+    service.create_task("Dishes")
+    service.create_task("Laundry")
+    service.create_task("Groceries")
+
+    def row_texts(task_list: TaskList) -> list[str]:
+        return [
+            str(row.render()).split("\n")[0]
+            for row in task_list.query_children(TaskRow)
+        ]
+
+    async with run_list_app(TaskList) as pilot:
+        task_list = pilot.app.query_one(TaskList)
+        await pilot.pause()
+        rows = list(task_list.query_children(TaskRow))
+
+        laundry, groceries = task_list.tasks[1:]
+        service.update_task(laundry, description="Fold laundry")
+        service.delete_task(groceries)
+        task_list.refresh_tasks()
+        await pilot.pause()
+
+        assert list(task_list.query_children(TaskRow)) == rows[:2]
+        assert row_texts(task_list) == ["Dishes", "Fold laundry"]
+
+
+def test_description_segments():
+    """Tags become styled segments; a bare sigil stays in the plain text."""
+    assert _description_segments("Call @mom re +party @ 5pm due:2025-01-01") == (
+        ("Call ", None),
+        ("@mom", "context"),
+        (" re ", None),
+        ("+party", "project"),
+        (" @ 5pm", None),
+    )
+
+
+def test_due_sort_key_puts_undated_tasks_last():
+    """Tasks sort by due date, with undated tasks last in original order."""
+    tasks = [
+        Task(description="none 1"),
+        Task(description="late", attributes={"due": "2025-03-01"}),
+        Task(description="none 2"),
+        Task(description="soon", attributes={"due": "2025-01-15"}),
+    ]
+
+    ordered = sorted(tasks, key=_SORT_KEYS["due"])
+
+    assert [t.description for t in ordered] == ["soon", "late", "none 1", "none 2"]
+
+
+def test_context_sort_key_uses_first_context():
+    """Tasks sort by their first context, untagged tasks last."""
+    tasks = [
+        Task(description="none"),
+        Task(description="b @work @aa"),
+        Task(description="a @home"),
+    ]
+
+    ordered = sorted(tasks, key=_SORT_KEYS["context"])
+
+    assert [t.description for t in ordered] == ["a @home", "b @work @aa", "none"]